@@ -1,5 +1,14 @@
 """Stonkers."""
 
-from . import auth, client
+import importlib
 
 __all__ = ["auth", "client"]
+
+
+def __getattr__(name):
+    # NOTE(jkoelker) Lazily import the submodules, `client` drags in
+    #                `tda`/`pandas` which the CLI does not always need.
+    if name in __all__:
+        return importlib.import_module(f".{name}", __name__)
+
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -4,55 +4,235 @@ Stonkers CLI.
 """
 
 import asyncio
+import atexit
+import datetime
 import functools
 import inspect
 import json
+import logging
 import os
-import urllib.parse
+import time
 
 import click
-import httpx
-import pandas as pd
 import yaml
 
-from . import auth, client, commands
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# NOTE(jkoelker) `pandas`, `httpx`, and the `.commands`/`.client` chain
+#                (`tda`, `scipy`, ...) cost several hundred ms to import.
+#                They are imported lazily at the call sites so `--help`
+#                and `setup` stay fast.
+
+LOG = logging.getLogger(__name__)
 
 APP_NAME = "stonkers"
 
+# NOTE(jkoelker) Prefer the libyaml C implementations when available, they
+#                are ~10x faster than the pure python parser/emitter.
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+Dumper = getattr(yaml, "CSafeDumper", yaml.SafeDumper)
+
 API_KEY = "api_key"
 REDIRECT_URI = "redirect_uri"
 
+
+def yaml_load(stream):
+    """Parse YAML with the C loader where we control the call site.
+
+    Deliberately not patched into `yaml` globally so transitive imports
+    keep whatever loader they asked for.
+    """
+    return yaml.load(stream, Loader=Loader)
+
+
 OUTPUT_JSON = "json"
 OUTPUT_YAML = "yaml"
 OUTPUT_CONSOLE = "console"
 
+# NOTE(jkoelker) (bucket, weight) of each symbol within its bucket
+ALLOCATIONS = {
+    "VGT": ("stock", 0.05),  # Vanguard Information Technology ETF
+    "VNQ": ("stock", 0.05),  # Vanguard Real Estate ETF
+    "VTI": ("stock", 0.6),  # Vanguard Total Stock Market ETF
+    "VXUS": ("stock", 0.3),  # Vanguard Total International Stock ETF
+    "BND": ("bonds", 0.8),  # Vanguard Total Bond Market ETF
+    "BNDX": ("bonds", 0.2),  # Vanguard Total International Bond ETF
+}
+
+EXPIRING_COLUMNS = (
+    "symbol",
+    "quantity",
+    "underlyingPrice",
+    "strikePrice",
+    "expirationDate",
+    "daysToExpiration",
+    "bidPrice",
+    "askPrice",
+    "premium",
+    "profitLoss",
+)
+
+EXPIRING_RENAME = {
+    "symbol": "💸",
+    "quantity": "Quantity",
+    "underlyingPrice": "Underlying",
+    "strikePrice": "Strike",
+    "expirationDate": "Exp Date",
+    "daysToExpiration": "DTE",
+    "bidPrice": "Bid",
+    "askPrice": "Ask",
+    "premium": "Premium",
+    "profitLoss": "P/L Open",
+}
+
+PUTS_COLUMNS = (
+    "symbol",
+    "underlying.last",
+    "strikePrice",
+    "expirationDate",
+    "daysToExpiration",
+    "bid",
+    "pop",
+    "putReturn",
+    "annualReturn",
+)
+
+
+@functools.lru_cache(maxsize=None)
+def _columns_index(columns):
+    """Cache the `pd.Index` for a column selection so repeat calls skip
+    the list-to-Index conversion."""
+    import pandas as pd
+
+    return pd.Index(columns)
+
+
+PUTS_RENAME = {
+    "symbol": "💸",
+    "underlying.last": "Underlying",
+    "strikePrice": "Strike",
+    "expirationDate": "Exp Date",
+    "daysToExpiration": "DTE",
+    "bid": "Bid",
+    "pop": "PoP %",
+    "putReturn": "Ret. %",
+    "annualReturn": "Annual %",
+}
+
+
+class cached_property:  # pylint: disable=invalid-name
+    """
+    Non-locking `functools.cached_property`. The CLI is single threaded,
+    so skip the per-class RLock on every access.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, func):
+        self.func = func
+        self.name = func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+
+        value = self.func(obj)
+        obj.__dict__[self.name] = value
+        return value
+
+
+_LOOP = None
+
+
+def get_event_loop():
+    """Persistent event loop shared across command invocations.
+
+    `asyncio.run` tears down the loop (and any loop-bound connection
+    pools) every call, this keeps them alive for the process.
+    """
+    global _LOOP  # pylint: disable=global-statement
+
+    if _LOOP is None:
+        _LOOP = asyncio.new_event_loop()
+        atexit.register(_LOOP.close)
+
+    return _LOOP
+
 
 def make_sync(func):
     @functools.wraps(func)
     def wrapper(*args, **kwargs):
-        return asyncio.run(func(*args, **kwargs))
+        return get_event_loop().run_until_complete(func(*args, **kwargs))
 
     return wrapper
 
 
-class ThetaGang:  # pylint:disable=too-few-public-methods
+class ThetaGang:
     """
     ThetaGang is a wrapper around the ThetaGang API.
     """
 
     HOST = "https://api.thetagang.com"
+    TRENDS_TTL = 60
+
+    def __init__(self):
+        self._client = None
+        self._trends = None
+        self._trends_ts = 0.0
+
+    @property
+    def client(self):
+        """Lazily created `httpx.Client` so repeat calls reuse the
+        pooled TLS connection."""
+        import importlib.util
+
+        import httpx
+
+        if self._client is None:
+            self._client = httpx.Client(
+                base_url=self.HOST,
+                timeout=5,
+                # NOTE(jkoelker) Multiplex over HTTP/2 when the optional
+                #                h2 dependency is installed
+                http2=importlib.util.find_spec("h2") is not None,
+                limits=httpx.Limits(
+                    max_keepalive_connections=2, max_connections=4
+                ),
+            )
+            atexit.register(self._client.close)
+
+        return self._client
 
     def trending(self):
         """Get trending tickers from ThetaGang."""
-        url = urllib.parse.urljoin(self.HOST, "/trends")
-        request = httpx.get(url, timeout=5)
+        import httpx
+
+        if (
+            self._trends is not None
+            and time.monotonic() - self._trends_ts < self.TRENDS_TTL
+        ):
+            return self._trends
+
+        request = self.client.get("/trends")
 
         try:
             request.raise_for_status()
         except httpx.HTTPError:
             return []
 
-        return request.json().get("data", {}).get("trends", [])
+        if orjson is not None:
+            data = orjson.loads(request.content)
+        else:
+            data = request.json()
+
+        self._trends = data.get("data", {}).get("trends", [])
+        self._trends_ts = time.monotonic()
+
+        return self._trends
 
 
 class Stonkers:
@@ -65,7 +245,14 @@ class Stonkers:
         self.output_format = output_format
         self.token_file = token_file
 
-    @functools.cached_property
+        # NOTE(jkoelker) Bind the formatter once, `format` is called per
+        #                command output
+        self._format = {
+            OUTPUT_JSON: self._format_json,
+            OUTPUT_YAML: self._format_yaml,
+        }.get(output_format, self._format_console)
+
+    @cached_property
     def thetagang(self):
         """ThetaGang API."""
         return ThetaGang()
@@ -74,6 +261,7 @@ class Stonkers:
         tickers = self.thetagang.trending()
 
         if not tickers:
+            LOG.debug("No trending tickers, falling back to GME")
             tickers = ({"symbol": "GME"},)
 
         return [
@@ -82,11 +270,13 @@ class Stonkers:
             if t.get("symbol") not in exclude + (None,)
         ]
 
-    @functools.cached_property
+    @cached_property
     def client(self):
         """TD Ameritrade Client."""
+        from . import auth, client
+
         with click.open_file(self.creds_file, "r") as file:
-            config = yaml.safe_load(file)
+            config = yaml_load(file)
             return client.Client(
                 auth.get_client(
                     config[API_KEY],
@@ -96,27 +286,63 @@ class Stonkers:
                 )
             )
 
-    def format(self, data, **kwargs):
-        """Format the data based on the output format."""
-        if self.output_format == OUTPUT_JSON:
-            if hasattr(data, "to_json"):
-                return data.to_json(orient="records", indent=2)
+    @staticmethod
+    def _records(data):
+        """DataFrame rows as plain dicts, cheaper than `to_dict` for the
+        small frames the CLI renders."""
+        if not len(data):
+            return []
 
-            return json.dumps(data, indent=2)
+        columns = data.columns.tolist()
+
+        return [
+            dict(zip(columns, row))
+            for row in data.itertuples(index=False, name=None)
+        ]
+
+    @staticmethod
+    def _format_json(data, **_kwargs):
+        if orjson is not None:
+            import pandas as pd
 
-        if self.output_format == OUTPUT_YAML:
             if isinstance(data, (pd.Index, pd.Series)):
                 data = data.to_list()
 
             if isinstance(data, pd.DataFrame):
-                data = data.to_dict(orient="records")
+                data = Stonkers._records(data)
+
+            return orjson.dumps(
+                data,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY,
+            ).decode()
+
+        if hasattr(data, "to_json"):
+            return data.to_json(orient="records", indent=2)
+
+        return json.dumps(data, indent=2)
+
+    @staticmethod
+    def _format_yaml(data, **_kwargs):
+        import pandas as pd
+
+        if isinstance(data, (pd.Index, pd.Series)):
+            data = data.to_list()
+
+        if isinstance(data, pd.DataFrame):
+            data = Stonkers._records(data)
 
-            return yaml.safe_dump(data)
+        return yaml.dump(data, Dumper=Dumper)
 
+    @staticmethod
+    def _format_console(data, **kwargs):
         if hasattr(data, "to_markdown"):
             return data.to_markdown(**kwargs)
 
-        return yaml.dump(data)
+        return yaml.dump(data, Dumper=Dumper)
+
+    def format(self, data, **kwargs):
+        """Format the data based on the output format."""
+        return self._format(data, **kwargs)
 
 
 class AsyncContext(click.Context):
@@ -124,40 +350,41 @@ class AsyncContext(click.Context):
         r = super().invoke(*args, **kwargs)
 
         if inspect.isawaitable(r):
-            return asyncio.run(r)
+            return get_event_loop().run_until_complete(r)
 
         return r
 
 
 click.Command.context_class = AsyncContext
 
+# NOTE(jkoelker) Module local partial so `click.option` itself is left
+#                untouched for other importers
+option = functools.partial(click.option, show_default=True)
+
 
 @click.group()
-@click.option(
+@option(
     "-c",
     "--creds-file",
     envvar="CREDS_FILE",
     type=click.Path(allow_dash=True),
-    show_default=True,
     help="Credentials yaml file containing `api_key` and `redirect_uri`.",
     default=os.path.join(click.get_app_dir(APP_NAME), "creds.yaml"),
 )
-@click.option(
+@option(
     "-o",
     "--output",
     type=click.Choice(
         [OUTPUT_JSON, OUTPUT_YAML, OUTPUT_CONSOLE], case_sensitive=False
     ),
-    show_default=True,
     help="Output format",
     default=OUTPUT_CONSOLE,
 )
-@click.option(
+@option(
     "-t",
     "--token-file",
     envvar="TOKEN_FILE",
     type=click.Path(),
-    show_default=True,
     help="Token file for TD Ameritrade OAuth.",
     default=os.path.join(click.get_app_dir(APP_NAME), "token.json"),
 )
@@ -170,21 +397,19 @@ def cli(ctx, creds_file, output, token_file):
 
 
 @cli.command()
-@click.option(
+@option(
     "-a",
     "--api-key",
     prompt=True,
     hide_input=True,
     confirmation_prompt=True,
     envvar="API_KEY",
-    show_default=True,
 )
-@click.option(
+@option(
     "-r",
     "--redirect-uri",
     prompt=True,
     envvar="REDIRECT_URI",
-    show_default=True,
 )
 @click.help_option("-h", "--help")
 @click.pass_obj
@@ -195,7 +420,11 @@ def setup(stonkers, api_key, redirect_uri):
 
     if stonkers.creds_file != "-":
         with click.open_file(stonkers.creds_file, "w") as f:
-            yaml.dump({API_KEY: api_key, REDIRECT_URI: redirect_uri}, f)
+            yaml.dump(
+                {API_KEY: api_key, REDIRECT_URI: redirect_uri},
+                f,
+                Dumper=Dumper,
+            )
 
         os.chmod(stonkers.creds_file, 0o600)
 
@@ -232,29 +461,29 @@ async def list_accounts(stonkers):
 @click.help_option("-h", "--help")
 @click.argument("account_id")
 @click.argument("funds", type=float)
-@click.option(
+@option(
     "--risk",
     "-r",
     default=90,
-    show_default=True,
 )
 @click.pass_obj
 async def rebalance(stonkers, account_id, funds, risk):
     """Rebalance."""
+    import pandas as pd
+
+    from . import commands
+
     # TODO(jkoelker) make this configurable
     # 90% stock 10% bonds portfolio
     # bonds: 80% domestic 20% international
     # stock: 60% domestic 30% international 5% reit 5% tech
-    bonds = 100 - risk
+    buckets = {"stock": risk, "bonds": 100 - risk}
     allocations = pd.Series(
         {
-            "VGT": risk * 0.05 / 100,  # Vanguard Information Technology ETF
-            "VNQ": risk * 0.05 / 100,  # Vanguard Real Estate ETF
-            "VTI": risk * 0.6 / 100,  # Vanguard Total Stock Market ETF
-            "VXUS": risk * 0.3 / 100,  # Vanguard Total International Stock ETF
-            "BND": bonds * 0.8 / 100,  # Vanguard Total Bond Market ETF
-            "BNDX": bonds * 0.2 / 100,  # Vanguard Total International Bond ETF
-        }
+            symbol: buckets[bucket] * weight / 100
+            for symbol, (bucket, weight) in ALLOCATIONS.items()
+        },
+        dtype="float64",
     )
 
     positions = await stonkers.client.positions(account_id)
@@ -271,7 +500,7 @@ async def rebalance(stonkers, account_id, funds, risk):
 
     def display_portfolio(portfolio, prices, allocations):
         values = portfolio * prices
-        value = sum(values)
+        value = values.sum()
         balance = portfolio * prices / value
         drift = balance - allocations
 
@@ -293,11 +522,20 @@ async def rebalance(stonkers, account_id, funds, risk):
         number_fields = ["Shares", "Value", "Price"]
         percentage_fields = ["Balance", "Allocation", "Drift"]
 
-        summary[number_fields] = summary[number_fields].map(
-            lambda x: f"{x:,.2f}"
-        )
-        summary[percentage_fields] = summary[percentage_fields].map(
-            lambda x: f"{x:,.2%}"
+        def fmt(spec):
+            # NOTE(jkoelker) Format whole columns off the ndarray instead
+            #                of dispatching a lambda per cell via `.map`
+            def _fmt(col):
+                return pd.Series(
+                    [f"{x:{spec}}" for x in col.to_numpy()],
+                    index=col.index,
+                )
+
+            return _fmt
+
+        summary[number_fields] = summary[number_fields].apply(fmt(",.2f"))
+        summary[percentage_fields] = summary[percentage_fields].apply(
+            fmt(",.2%")
         )
 
         return summary
@@ -307,8 +545,10 @@ async def rebalance(stonkers, account_id, funds, risk):
     print(stonkers.format(current))
     print()
 
+    total_cost = cost.sum()
     print(
-        f"Buy for a total cost of ${sum(cost):,.2f} (${funds - sum(cost):,.2f} left)"
+        f"Buy for a total cost of ${total_cost:,.2f}"
+        f" (${funds - total_cost:,.2f} left)"
     )
     print(stonkers.format(buy))
     print()
@@ -325,11 +565,10 @@ def options_group():
 
 
 @options_group.command(name="expiring")
-@click.option(
+@option(
     "-d",
     "--dte",
     default=5,
-    show_default=True,
     help="Days to expiration.",
 )
 @click.argument("account_id")
@@ -337,6 +576,9 @@ def options_group():
 @click.pass_obj
 async def expiring_options(stonkers, dte, account_id):
     """Find option positions that are expiring within DTE."""
+    import numpy as np
+    import pandas as pd
+
     positions = await stonkers.client.positions(account_id)
 
     options = positions[
@@ -345,8 +587,8 @@ async def expiring_options(stonkers, dte, account_id):
 
     prices = await stonkers.client.quote(options.index)
 
-    # NOTE(jkoelker) Make a new DataFrame so it is is not a view
-    expiring = pd.DataFrame(prices[prices["daysToExpiration"] <= dte])
+    # NOTE(jkoelker) Copy so it is is not a view
+    expiring = prices[prices["daysToExpiration"] <= dte].copy()
 
     if expiring.empty:
         print(f"Nothing expiring in {dte} days")
@@ -355,104 +597,74 @@ async def expiring_options(stonkers, dte, account_id):
     expiring["quantity"] = options["longQuantity"] - options["shortQuantity"]
     expiring["premium"] = expiring["quantity"] * options["averagePrice"]
 
-    expiring["profitLoss"] = (
-        expiring["quantity"] * expiring["bidPrice"]
-    ).where(
-        cond=(expiring["quantity"] > 0),
-        other=expiring["quantity"] * expiring["askPrice"],
-    ) - expiring[
-        "premium"
-    ]
-
-    expiring["expirationDate"] = pd.to_datetime(
-        expiring[
-            ["expirationYear", "expirationMonth", "expirationDay"]
-        ].rename(
-            columns={
-                "expirationYear": "year",
-                "expirationMonth": "month",
-                "expirationDay": "day",
-            }
-        )
+    # NOTE(jkoelker) Branchless on the ndarrays, `Series.where` builds
+    #                both sides as full Series first
+    quantity = expiring["quantity"].to_numpy()
+    price = np.where(
+        quantity > 0,
+        expiring["bidPrice"].to_numpy(),
+        expiring["askPrice"].to_numpy(),
     )
-    expiring["expirationDate"] = expiring["expirationDate"].dt.date
-
-    expiring.reset_index(level=0, inplace=True)
-
-    expiring = expiring[
-        [
-            "symbol",
-            "quantity",
-            "underlyingPrice",
-            "strikePrice",
-            "expirationDate",
-            "daysToExpiration",
-            "bidPrice",
-            "askPrice",
-            "premium",
-            "profitLoss",
-        ]
+    expiring["profitLoss"] = quantity * price - expiring["premium"].to_numpy()
+
+    # NOTE(jkoelker) Assemble dates directly, `pd.to_datetime` on a
+    #                year/month/day frame goes through per-row assembly
+    #                plus two intermediate DataFrames
+    expiring["expirationDate"] = [
+        datetime.date(int(year), int(month), int(day))
+        for year, month, day in zip(
+            expiring["expirationYear"],
+            expiring["expirationMonth"],
+            expiring["expirationDay"],
+        )
     ]
 
-    expiring = expiring.rename(
-        columns={
-            "symbol": "💸",
-            "quantity": "Quantity",
-            "underlyingPrice": "Underlying",
-            "strikePrice": "Strike",
-            "expirationDate": "Exp Date",
-            "daysToExpiration": "DTE",
-            "bidPrice": "Bid",
-            "askPrice": "Ask",
-            "premium": "Premium",
-            "profitLoss": "P/L Open",
-        }
+    # NOTE(jkoelker) Pull the symbol out of the index directly instead of
+    #                paying for a full `reset_index` copy
+    expiring["symbol"] = expiring.index.to_numpy()
+
+    expiring = expiring.loc[:, _columns_index(EXPIRING_COLUMNS)].rename(
+        columns=EXPIRING_RENAME
     )
 
     print(stonkers.format(expiring, index=False))
 
 
 @options_group.command()
-@click.option(
+@option(
     "-d",
     "--dte-min",
     default=0,
-    show_default=True,
     help="Days to expiration min.",
 )
-@click.option(
+@option(
     "-D",
     "--dte-max",
     default=60,
-    show_default=True,
     help="Days to expiration max.",
 )
-@click.option(
+@option(
     "-p",
     "--pop-min",
     default=70,
-    show_default=True,
     help="Probability of Profit minimum.",
 )
-@click.option(
+@option(
     "-P",
     "--pop-max",
     default=90,
-    show_default=True,
     help="Probability of Profit maximum.",
 )
-@click.option(
+@option(
     "-r",
     "--return-min",
     default=20,
-    show_default=True,
     help="Retun minimum value.",
 )
-@click.option(
+@option(
     "-e",
     "--exclude",
     multiple=True,
-    show_default=True,
     help="Exclude a ticker explicitly.",
 )
 @click.argument("tickers", nargs=-1)
@@ -470,8 +682,12 @@ async def puts(
     tickers,
 ):
     """Find options that meet an anual rate of return requirement."""
+    from . import commands
+
     if not tickers:
-        tickers = stonkers.default_tickers(exclude)
+        # NOTE(jkoelker) `default_tickers` does blocking HTTP, keep it off
+        #                the event loop
+        tickers = await asyncio.to_thread(stonkers.default_tickers, exclude)
 
     options = await commands.put_finder(
         stonkers.client,
@@ -482,64 +698,65 @@ async def puts(
         pop_max,
         return_min,
     )
-    options = options[
-        [
-            "symbol",
-            "underlying.last",
-            "strikePrice",
-            "expirationDate",
-            "daysToExpiration",
-            "bid",
-            "pop",
-            "putReturn",
-            "annualReturn",
-        ]
-    ]
-
-    options = options.rename(
-        columns={
-            "symbol": "💸",
-            "underlying.last": "Underlying",
-            "strikePrice": "Strike",
-            "expirationDate": "Exp Date",
-            "daysToExpiration": "DTE",
-            "bid": "Bid",
-            "pop": "PoP %",
-            "putReturn": "Ret. %",
-            "annualReturn": "Annual %",
-        }
+    options = options.loc[:, _columns_index(PUTS_COLUMNS)].rename(
+        columns=PUTS_RENAME
     )
 
     print(stonkers.format(options, index=False))
 
 
-def _combine_docstrings(*other_funcs):
-    """Combine docstrings from other functions onto the decorated function."""
+def _combine_docstrings(*providers):
+    """Combine docstrings from other objects onto the decorated function.
+
+    The providers are zero-argument callables resolved the first time
+    help is rendered, so the modules backing them are not imported at
+    CLI startup.
+    """
 
     def decorator(func):
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             return func(*args, **kwargs)
 
-        wrapper.__doc__ = (wrapper.__doc__ or "").strip("\n")
-
-        for other_func in other_funcs:
-            doc = (other_func.__doc__ or "").strip("\n")
-            if doc:
-                wrapper.__doc__ += "\n" + doc
+        wrapper.__lazy_docs__ = providers
 
         return wrapper
 
     return decorator
 
 
-@options_group.command()
-@click.option("-a", "--auto-send", is_flag=True, help="Auto send orders.")
+class LazyDocCommand(click.Command):
+    """Command that resolves `_combine_docstrings` providers on demand."""
+
+    def format_help_text(self, ctx, formatter):
+        providers = getattr(self.callback, "__lazy_docs__", ())
+
+        if providers:
+            docs = [(self.help or "").strip("\n")]
+            docs.extend(
+                (provider().__doc__ or "").strip("\n")
+                for provider in providers
+            )
+
+            self.help = "\n".join(doc for doc in docs if doc)
+            self.callback.__lazy_docs__ = ()
+
+        super().format_help_text(ctx, formatter)
+
+
+def _wheel_config():
+    from . import commands
+
+    return commands.WheelConfig
+
+
+@options_group.command(cls=LazyDocCommand)
+@option("-a", "--auto-send", is_flag=True, help="Auto send orders.")
 @click.argument("account_id")
 @click.argument("tickers", nargs=-1)
 @click.help_option("-h", "--help")
 @click.pass_obj
-@_combine_docstrings(commands.WheelConfig)
+@_combine_docstrings(_wheel_config)
 async def wheelie(stonkers, auto_send, account_id, tickers):
     # NOTE the docstring from commands.wheelie is appended to this one
     """
@@ -553,6 +770,7 @@ async def wheelie(stonkers, auto_send, account_id, tickers):
     value with configuration options seprarated by a colon like
     `NVDA:weight=0.1:sigma=0.2`. The following options are available:
     """
+    from . import commands
 
     await commands.wheelie(
         stonkers.client,
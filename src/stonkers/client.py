@@ -4,6 +4,11 @@ import asyncio
 import dataclasses
 import datetime
 import email.utils
+import hashlib
+import json
+import os
+import pathlib
+import time
 from typing import Optional
 
 import async_lru as alru
@@ -13,10 +18,80 @@ import tda.client  # type: ignore
 import tenacity
 import tenacity.wait
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from . import convert
 from .orders import OrderBuilder
 
 
+def _json(response: httpx.Response):
+    """Decode a response body, preferring orjson's fast path.
+
+    Option chains regularly exceed 1MB, stdlib `json` is the dominant
+    CPU cost before DataFrame construction.
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+
+    return response.json()
+
+
+# NOTE(jkoelker) Cap concurrent requests so gather()ing callers don't
+#                trip TDA's rate limit and thrash the retry path
+MAX_CONCURRENT_REQUESTS = 64
+
+CACHE_DIR = (
+    pathlib.Path(
+        os.environ.get("XDG_CACHE_HOME", pathlib.Path.home() / ".cache")
+    )
+    / "stonkers"
+)
+
+
+def _hours_cache_path(date: datetime.date) -> pathlib.Path:
+    return CACHE_DIR / f"hours-{date.isoformat()}.json"
+
+
+def _read_hours_cache(date: datetime.date) -> Optional[bool]:
+    """Market hours for a date never change once fetched, so the date in
+    the filename is the whole cache key."""
+    try:
+        data = _hours_cache_path(date).read_bytes()
+    except OSError:
+        return None
+
+    try:
+        payload = (
+            orjson.loads(data) if orjson is not None else json.loads(data)
+        )
+    except ValueError:
+        return None
+
+    return payload.get("isOpen")
+
+
+def _write_hours_cache(date: datetime.date, is_open: bool) -> None:
+    path = _hours_cache_path(date)
+    payload = {"isOpen": is_open}
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_bytes(
+            orjson.dumps(payload)
+            if orjson is not None
+            else json.dumps(payload).encode()
+        )
+        os.replace(tmp, path)
+    except OSError:
+        # NOTE(jkoelker) The disk cache is best effort only
+        pass
+
+
 def _get_response(
     retry_state: tenacity.RetryCallState,
 ) -> Optional[httpx.Response]:
@@ -59,7 +134,102 @@ class WaitRetryAfter(tenacity.wait.wait_base):
         except (TypeError, ValueError):
             return 0
 
-        return max(0, (when - datetime.datetime.utcnow()).total_seconds())
+        # NOTE(jkoelker) `parsedate_to_datetime` is tz-aware, a naive
+        #                utcnow() here raises TypeError on subtraction
+        now = datetime.datetime.now(datetime.timezone.utc)
+        return max(0.0, (when - now).total_seconds())
+
+
+class PersistentTTLCache(cachetools.TTLCache):
+    """A TTLCache that writes through to `CACHE_DIR/<name>/`.
+
+    RAM is the L1; a miss falls back to a disk entry whose mtime is
+    still inside the TTL, so repeated CLI invocations within the TTL
+    window skip the round trip entirely. Disk writes are best effort,
+    the cache degrades to a plain TTLCache on any failure.
+    """
+
+    def __init__(self, name, maxsize, ttl):
+        super().__init__(maxsize=maxsize, ttl=ttl)
+        self._dir = CACHE_DIR / name
+
+    # NOTE(jkoelker) repr of a frozenset follows per-process hash
+    #                seeds, so digesting it would give every CLI
+    #                invocation a different filename; serialize
+    #                containers in sorted order instead
+    @classmethod
+    def _canonical(cls, key) -> str:
+        if isinstance(key, (frozenset, set)):
+            return "{" + ",".join(sorted(map(cls._canonical, key))) + "}"
+
+        if isinstance(key, tuple):
+            return "(" + ",".join(map(cls._canonical, key)) + ")"
+
+        return repr(key)
+
+    def _path(self, key) -> pathlib.Path:
+        digest = hashlib.sha1(self._canonical(key).encode()).hexdigest()
+        return self._dir / f"{digest}.json"
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+
+        path = self._path(key)
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+
+            tmp = path.with_name(path.name + ".tmp")
+            tmp.write_bytes(
+                orjson.dumps(value)
+                if orjson is not None
+                else json.dumps(value).encode()
+            )
+            os.replace(tmp, path)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def __delitem__(self, key):
+        # NOTE(jkoelker) Unlink the disk entry too; leaving it behind
+        #                lets the next miss resurrect the stale value
+        #                through __missing__ for the rest of the TTL
+        try:
+            super().__delitem__(key)
+        finally:
+            try:
+                self._path(key).unlink()
+            except OSError:
+                pass
+
+    def __missing__(self, key):
+        path = self._path(key)
+
+        try:
+            if time.time() - path.stat().st_mtime >= self.ttl:
+                raise KeyError(key)
+
+            data = path.read_bytes()
+            value = (
+                orjson.loads(data) if orjson is not None else json.loads(data)
+            )
+        except (OSError, ValueError):
+            raise KeyError(key) from None
+
+        # NOTE(jkoelker) Promote to RAM without rewriting the file, a
+        #                fresh mtime would silently extend the TTL
+        cachetools.TTLCache.__setitem__(self, key, value)
+
+        return value
+
+    def __contains__(self, key):
+        if super().__contains__(key):
+            return True
+
+        try:
+            self[key]
+        except KeyError:
+            return False
+
+        return True
 
 
 @dataclasses.dataclass
@@ -67,6 +237,7 @@ class Cache:
     orders: cachetools.TTLCache
     options: cachetools.TTLCache
     quotes: cachetools.TTLCache
+    hours: cachetools.TTLCache
 
 
 class Client:
@@ -77,11 +248,34 @@ class Client:
     def __init__(self, tda_client: tda.client.AsyncClient):
         self.tda = tda_client
 
+        # NOTE(jkoelker) hours has its own date-keyed disk layer, see
+        #                is_equities_open_on
         self._cache = Cache(
-            orders=cachetools.TTLCache(maxsize=1000, ttl=10),
-            options=cachetools.TTLCache(maxsize=1000, ttl=10),
-            quotes=cachetools.TTLCache(maxsize=1000, ttl=10),
+            orders=PersistentTTLCache("orders", maxsize=1000, ttl=10),
+            options=PersistentTTLCache("options", maxsize=1000, ttl=10),
+            quotes=PersistentTTLCache("quotes", maxsize=1000, ttl=10),
+            hours=cachetools.TTLCache(maxsize=100, ttl=3600),
         )
+        self._inflight: dict = {}
+        self._sem = asyncio.Semaphore(MAX_CONCURRENT_REQUESTS)
+
+    async def _coalesce(self, key, factory):
+        """Share one in-flight request between concurrent identical calls.
+
+        The TTL caches only help after a response lands; without this,
+        two concurrent misses for the same key fire duplicate HTTP
+        requests.
+        """
+        future = self._inflight.get(key)
+
+        if future is None:
+            future = asyncio.ensure_future(factory())
+            self._inflight[key] = future
+            future.add_done_callback(
+                lambda _future: self._inflight.pop(key, None)
+            )
+
+        return await future
 
     @tenacity.retry(
         reraise=True,
@@ -92,13 +286,33 @@ class Client:
         stop=tenacity.stop_after_attempt(5),
     )
     async def _get(self, func, *args, **kwargs):
-        response = await func(*args, **kwargs)
+        async with self._sem:
+            response = await func(*args, **kwargs)
+
         response.raise_for_status()
 
         return response
 
     @staticmethod
     def _accounts(accounts, dataframe=True, principals=None):
+        if dataframe:
+            # NOTE(jkoelker) Build the frame in one pass and bolt the
+            #                displayName on with a C-level index map
+            #                instead of rebuilding a dict-of-dicts
+            frame = convert.accounts(
+                [account["securitiesAccount"] for account in accounts]
+            )
+
+            if principals:
+                frame["displayName"] = frame.index.map(
+                    {
+                        account["accountId"]: account.get("displayName", "")
+                        for account in principals.get("accounts", [])
+                    }
+                ).fillna("")
+
+            return frame
+
         accounts = {
             account["securitiesAccount"]["accountId"]: account[
                 "securitiesAccount"
@@ -115,9 +329,6 @@ class Client:
                     "displayName", ""
                 )
 
-        if dataframe:
-            return convert.accounts(accounts)
-
         return accounts
 
     async def _get_accounts(
@@ -127,10 +338,16 @@ class Client:
             self.tda.get_account if account_id else self.tda.get_accounts
         )
 
-        accounts = (
-            [(await self._get(get_func, account_id, fields=fields)).json()]
-            if account_id
-            else (await get_func(fields=fields)).json()
+        async def fetch():
+            if account_id:
+                return [
+                    _json(await self._get(get_func, account_id, fields=fields))
+                ]
+
+            return _json(await get_func(fields=fields))
+
+        accounts = await self._coalesce(
+            ("accounts", account_id, fields), fetch
         )
 
         principals = None
@@ -141,25 +358,53 @@ class Client:
             accounts, dataframe=dataframe, principals=principals
         )
 
+    async def is_market_open_on(self, market, date=None) -> bool:
+        """Whether `market` is open on `date`.
+
+        All markets are fetched in one batched request and fanned out
+        into per (market, date) cache entries, so asking about another
+        market the same session costs no round trip.
+        """
+        if date is None:
+            date = datetime.date.today()
+
+        market = getattr(market, "value", market)
+
+        if (market, date) not in self._cache.hours:
+            result = _json(
+                await self._get(
+                    self.tda.get_hours_for_multiple_markets,
+                    markets=list(self.tda.Markets),
+                    date=date,
+                )
+            )
+
+            for product in result.values():
+                for session in product.values():
+                    market_type = session.get("marketType")
+                    key = (market_type, date)
+
+                    if market_type and key not in self._cache.hours:
+                        self._cache.hours[key] = session.get("isOpen", False)
+
+        return self._cache.hours.get((market, date), False)
+
     @alru.alru_cache
     async def is_equities_open_on(self, date=None) -> bool:
         if date is None:
             date = datetime.date.today()
 
-        result = (
-            await self._get(
-                self.tda.get_hours_for_multiple_markets,
-                markets=self.tda.Markets.EQUITY,
-                date=date,
-            )
-        ).json()
+        # NOTE(jkoelker) alru is the L1, disk is the L2 so fresh
+        #                processes skip the round trip
+        cached = _read_hours_cache(date)
+        if cached is not None:
+            return cached
 
-        for key in result:
-            for subkey in result.get(key, {}):
-                if result[key][subkey].get("marketType") == "EQUITY":
-                    return result[key][subkey].get("isOpen", False)
+        is_open = await self.is_market_open_on(self.tda.Markets.EQUITY, date)
 
-        return False
+        _write_hours_cache(date, is_open)
+
+        return is_open
 
     @property
     @alru.alru_cache
@@ -173,12 +418,24 @@ class Client:
         return self._get_accounts(None, fields, dataframe, augment)
 
     async def options(self, symbol, dataframe=True, **kwargs):
-        if symbol not in self._cache.options:
-            self._cache.options[symbol] = (
-                await self._get(self.tda.get_option_chain, symbol, **kwargs)
-            ).json()
+        # NOTE(jkoelker) The parameters shape the chain payload, they
+        #                have to be part of the cache key
+        key = (symbol, frozenset(kwargs.items()))
+
+        if key not in self._cache.options:
 
-        options = self._cache.options[symbol]
+            async def fetch():
+                return _json(
+                    await self._get(
+                        self.tda.get_option_chain, symbol, **kwargs
+                    )
+                )
+
+            self._cache.options[key] = await self._coalesce(
+                ("options", *key), fetch
+            )
+
+        options = self._cache.options[key]
 
         if dataframe:
             return convert.options(options)
@@ -186,12 +443,13 @@ class Client:
         return options
 
     async def _quote(self, symbols):
-        response = await self._get(self.tda.get_quotes, symbols)
-        response.raise_for_status()
-
-        quotes = response.json()
+        # NOTE(jkoelker) `_get` already raises for status
+        quotes = _json(await self._get(self.tda.get_quotes, symbols))
 
-        self._cache.quotes.update(quotes)
+        # NOTE(jkoelker) Keep the cache key contract explicit: one entry
+        #                per symbol
+        for symbol, payload in quotes.items():
+            self._cache.quotes[symbol] = payload
 
         return quotes
 
@@ -201,15 +459,20 @@ class Client:
 
         symbols = set(symbols)
 
-        quotes = {}
-
-        for symbol in set(symbols):
-            if symbol in self._cache.quotes:
-                quotes[symbol] = self._cache.quotes[symbol]
-                symbols.remove(symbol)
+        quotes = {
+            symbol: self._cache.quotes[symbol]
+            for symbol in symbols
+            if symbol in self._cache.quotes
+        }
 
-        if symbols:
-            quotes.update(await self._quote(symbols))
+        missing = symbols - quotes.keys()
+        if missing:
+            quotes.update(
+                await self._coalesce(
+                    ("quotes", frozenset(missing)),
+                    lambda: self._quote(missing),
+                )
+            )
 
         if dataframe:
             return convert.quote(quotes)
@@ -250,7 +513,7 @@ class Client:
         return account["positions"].iloc[0]
 
     async def user_principals(self, dataframe=True):
-        principals = (await self._get(self.tda.get_user_principals)).json()
+        principals = _json(await self._get(self.tda.get_user_principals))
 
         if dataframe:
             return convert.user_principals(principals)
@@ -265,7 +528,7 @@ class Client:
         need_extended_hours_data=None,
         dataframe=True,
     ):
-        price_history = (
+        price_history = _json(
             await self._get(
                 self.tda.get_price_history_every_day,
                 symbol,
@@ -273,7 +536,7 @@ class Client:
                 start_datetime=start_datetime,
                 need_extended_hours_data=need_extended_hours_data,
             )
-        ).json()
+        )
 
         if dataframe:
             return convert.price_history(price_history)
@@ -1,16 +1,37 @@
 #
 
+import asyncio
 import datetime as dt
-
-import pandas as pd
+import math
 
 from .. import convert
 
+# NOTE(jkoelker) Cap the chain fetches racing to the same host
+MAX_CONCURRENT_FETCHES = 64
+
+# NOTE(jkoelker) The only chain fields the scan touches; everything
+#                else TDA returns never needs to become a column
+OPTION_COLUMNS = frozenset(
+    {
+        "symbol",
+        "bid",
+        "strikePrice",
+        "daysToExpiration",
+        "delta",
+        "expirationDate",
+        "underlying.symbol",
+        "pop",
+        "putReturn",
+        "annualReturn",
+    }
+)
+
 
 def get_returns(bid, strike_price, dte):
     """Calculate return and annual return for a sold option."""
-    put_return = bid / (strike_price - bid) * 100
-    annual_return = put_return / dte.apply(lambda x: x if x > 0 else 1) * 365
+    put_return = bid / (strike_price - bid) * 100.0
+    annual_return = put_return / max(dte, 1.0) * 365.0
+
     return (round(put_return, 1), round(annual_return, 1))
 
 
@@ -26,51 +47,112 @@ async def put_finder(
     """Find put options that meet our criteria."""
     now = dt.datetime.now().date()
 
-    # Get the options chain as a pandas dataframe. (Thanks dobby. 🤗)
-    chains = []
-    for ticker in tickers:
-        chain = await client.options(
-            ticker,
-            contract_type=client.tda.Options.ContractType.PUT,
-            include_quotes=True,
-            from_date=now + dt.timedelta(days=dte_min - 1),
-            to_date=now + dt.timedelta(days=dte_max + 1),
-            option_type=client.tda.Options.Type.STANDARD,
-            dataframe=False,
-        )
-
-        underlying = chain.get("underlying")
-
-        if chain:
-            chain = convert.options(chain)
-
-            if underlying:
-                for key, value in underlying.items():
-                    chain[f"underlying.{key}"] = value
-
-                chains.append(chain)
-
-    options = pd.concat(chains)
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+    async def fetch(ticker):
+        async with semaphore:
+            return await client.options(
+                ticker,
+                contract_type=client.tda.Options.ContractType.PUT,
+                include_quotes=True,
+                from_date=now + dt.timedelta(days=dte_min - 1),
+                to_date=now + dt.timedelta(days=dte_max + 1),
+                option_type=client.tda.Options.Type.STANDARD,
+                dataframe=False,
+            )
+
+    # NOTE(jkoelker) One batched round trip warms the shared quote cache
+    #                and backfills chains missing an embedded underlying
+    underlyings = await client.quote(tickers, dataframe=False)
+
+    # Get the options chains concurrently. (Thanks dobby. 🤗)
+    raw_chains = await asyncio.gather(*(fetch(ticker) for ticker in tickers))
+
+    survivors = []
+    underlying_map = {}
+
+    for ticker, chain in zip(tickers, raw_chains):
+        underlying = chain.get("underlying") or underlyings.get(ticker)
+
+        if underlying and "last" not in underlying:
+            # NOTE(jkoelker) Quote payloads spell it `lastPrice`
+            underlying = {**underlying, "last": underlying.get("lastPrice")}
+
+        if not chain or not underlying:
+            continue
+
+        # NOTE(jkoelker) Filter on the raw dicts so DataFrame costs
+        #                scale with the handful of survivors, not the
+        #                thousands of contracts per chain
+        for record in convert.options_records(chain):
+            try:
+                bid = float(record["bid"])
+                strike = float(record["strikePrice"])
+                delta = float(record["delta"])
+            except (KeyError, TypeError, ValueError):
+                continue
+
+            pop = (1.0 - abs(delta)) * 100.0
+            if math.isnan(pop) or not pop_min <= pop <= pop_max:
+                continue
+
+            if strike - bid <= 0:
+                continue
+
+            put_return, annual_return = get_returns(
+                bid, strike, float(record.get("daysToExpiration", 0))
+            )
+
+            if annual_return < return_min:
+                continue
+
+            # NOTE(jkoelker) Copy before annotating; the records are
+            #                nested inside the chain payload the client
+            #                TTL cache owns, and mutating them in place
+            #                would leak the columns into every other
+            #                consumer of the cached chain
+            survivors.append(
+                {
+                    **record,
+                    "pop": pop,
+                    "putReturn": put_return,
+                    "annualReturn": annual_return,
+                    "underlying.symbol": ticker,
+                }
+            )
+
+        underlying_map[ticker] = underlying
+
+    options = convert.options_frame(survivors, columns=OPTION_COLUMNS)
 
     if options.empty:
-        return options
+        # NOTE(jkoelker) The flattened underlying columns are part of
+        #                the schema the callers select on, so bolt them
+        #                onto the empty frame too
+        keys = {key for data in underlying_map.values() for key in data} or {
+            "last"
+        }
+
+        return options.reindex(
+            columns=[
+                *options.columns,
+                *sorted(f"underlying.{key}" for key in keys),
+            ]
+        )
 
-    # Calculate a return for the trade and an annualized return.
-    options["putReturn"], options["annualReturn"] = get_returns(
-        options["bid"], options["strikePrice"], options["daysToExpiration"]
-    )
+    # Flatten the underlying quotes with one vectorized map per key.
+    for key in {key for data in underlying_map.values() for key in data}:
+        options[f"underlying.{key}"] = options["underlying.symbol"].map(
+            {ticker: data.get(key) for ticker, data in underlying_map.items()}
+        )
 
-    # Calculate PoP based on the delta.
-    options["pop"] = (1 - options["delta"].abs()) * 100
+    options = options.sort_values("annualReturn", ascending=False)
 
-    # Remove the time of day information from the expiration date.
-    options["expirationDate"] = options["expirationDate"].dt.strftime(
-        "%Y-%m-%d"
+    # Remove the time of day information from the expiration date. Only
+    # the handful of unique expirations pay for the strftime.
+    expirations = options["expirationDate"].drop_duplicates()
+    options["expirationDate"] = options["expirationDate"].map(
+        dict(zip(expirations, expirations.dt.strftime("%Y-%m-%d")))
     )
 
-    # Select options that meet all of our requirements.
-    return options[
-        (options["annualReturn"] >= return_min)
-        & (pop_min <= options["pop"])
-        & (options["pop"] <= pop_max)
-    ].sort_values("annualReturn", ascending=False)
+    return options
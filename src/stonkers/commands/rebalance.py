@@ -1,10 +1,17 @@
 #
 
 import numpy as np
+import pandas as pd
 from scipy import optimize as opt  # type: ignore
 
 
 def rebalance(allocations, funds, portfolio, prices):
+    # NOTE(jkoelker) Label-align everything onto the allocation index
+    #                before any array math; quotes come back in
+    #                request order and the MILP below is positional
+    prices = prices.reindex(allocations.index)
+    portfolio = portfolio.reindex(allocations.index).fillna(0)
+
     values = portfolio * prices
 
     shares = allocations * funds / prices
@@ -12,40 +19,56 @@ def rebalance(allocations, funds, portfolio, prices):
     shares = np.floor(shares).astype(int)
 
     if sum(values) > 0:
+        # NOTE(jkoelker) Whole shares make this an integer program, so
+        #                solve it as one instead of rounding a
+        #                continuous SLSQP answer. Minimize the L1
+        #                distance of post-trade values from the target
+        #                allocation, linearized with one slack per
+        #                asset: |v_i - target_i| <= t_i.
+        prices_arr = prices.to_numpy(dtype=np.float64)
+        allocations_arr = allocations.to_numpy(dtype=np.float64)
+        values_arr = np.nan_to_num(values.to_numpy(dtype=np.float64))
 
-        def optimize(s):
-            values = portfolio.add(s, fill_value=0) * prices
-            balance = values / sum(values)
-
-            if any(b < 0 for b in balance[s > 0]):
-                return 1
+        count = len(prices_arr)
+        target = allocations_arr * (values_arr.sum() + funds)
 
-            return sum(allocations - balance)
+        cost = np.concatenate([np.zeros(count), np.ones(count)])
 
-        def funds_constraint(s):
-            return funds - sum(s * prices)
+        eye = np.eye(count)
+        deviation = np.diag(prices_arr)
+        constraints = [
+            # price_i * s_i - t_i <= target_i - value_i
+            opt.LinearConstraint(
+                np.hstack([deviation, -eye]),
+                ub=target - values_arr,
+            ),
+            # -price_i * s_i - t_i <= value_i - target_i
+            opt.LinearConstraint(
+                np.hstack([-deviation, -eye]),
+                ub=values_arr - target,
+            ),
+            # prices @ s <= funds
+            opt.LinearConstraint(
+                np.concatenate([prices_arr, np.zeros(count)]),
+                ub=funds,
+            ),
+        ]
 
-        # NOTE(jkoelker) figure out what this does exactly again ;(
-        def minimize_constraint(x):
-            return min(x[i] - int(x[i]) for i in range(len(x)))
-
-        constraints = (
-            {"type": "eq", "fun": funds_constraint},
-            {"type": "eq", "fun": minimize_constraint},
-        )
-        bounds = [(0, None) for _ in shares]
-        solution = opt.minimize(
-            optimize,
-            shares,
-            method="SLSQP",
+        solution = opt.milp(
+            cost,
             constraints=constraints,
-            bounds=bounds,
+            integrality=np.concatenate([np.ones(count), np.zeros(count)]),
+            bounds=opt.Bounds(lb=0),
         )
 
-        potential_buy = np.floor(solution.x).astype(int)
-        potential_cost = sum(potential_buy * prices)
+        if solution.success:
+            potential_buy = np.round(solution.x[:count]).astype(int)
+            potential_cost = float(np.dot(potential_buy, prices_arr))
 
-        if potential_cost > 0 and funds - potential_cost > 0:
-            return potential_buy
+            if potential_cost > 0 and funds - potential_cost >= 0:
+                # NOTE(jkoelker) Hand the labels back so the caller's
+                #                cost math aligns on tickers, not on
+                #                whatever order the quotes arrived in
+                return pd.Series(potential_buy, index=allocations.index)
 
     return shares
@@ -21,6 +21,10 @@ from .formatting import boldize, colorize, number, titlize
 from .positions import Positions
 from .wheel import Wheel
 
+# NOTE(jkoelker) Per-ticker wheels fan out several requests each; cap
+#                how many run at once so the broker API is not hammered
+MAX_CONCURRENT_WHEELS = 8
+
 
 def format_leg(leg: dict) -> str:
     """Formats a single leg of an order."""
@@ -88,46 +92,70 @@ async def wheelie(  # pylint: disable=too-many-locals
     tickers: Iterable[WheelConfig],
     auto_send_orders: bool = False,
 ):
-    _tickers = dict((ticker.ticker, ticker) for ticker in set(tickers))
+    # NOTE(jkoelker) Only ticker uniqueness matters; key on the symbol
+    #                in one pass instead of hashing every WheelConfig
+    #                into a set first
+    _tickers = {ticker.ticker: ticker for ticker in tickers}
 
     console = rich.console.Console()
 
-    with rich.live.Live(console=console, auto_refresh=False) as live:
-        account = AccountSummary(
-            account_id,
-            client,
-            update=lambda: live.update(account),
-        )
-        await account()
+    # NOTE(jkoelker) One Live region on a timed refresh; re-rendering
+    #                per update call would redraw the whole table from
+    #                inside the event loop and starve the HTTP tasks
+    with rich.live.Live(console=console, refresh_per_second=8) as live:
+        account = AccountSummary(account_id, client)
+        positions = Positions(_tickers.keys())
 
-    with rich.live.Live(console=console) as live:
-        positions = Positions(_tickers.keys(), lambda: live.update(positions))
-        await positions(client, account_id)
-        live.update(positions)
+        live.update(rich.console.Group(account, positions))
+
+        # NOTE(jkoelker) The configured tickers ride along in the one
+        #                batched quote call positions makes anyway
+        await asyncio.gather(
+            account(),
+            positions(client, account_id, extra_symbols=_tickers.keys()),
+        )
 
     with rich.progress.Progress(console=console) as progress:
         if _tickers:
-            quote_task = progress.add_task(
-                "Prefetching quotes...",
+            prefetch_task = progress.add_task(
+                "Prefetching option chains...",
                 total=1,
             )
 
-            await client.quote(symbols=_tickers.keys())
-            progress.advance(quote_task)
+            # NOTE(jkoelker) Every wheel fetches its chain anyway; one
+            #                concurrent batch warms the cache so the
+            #                per-ticker calls below never block on I/O
+            await asyncio.gather(
+                *(
+                    client.options(ticker, dataframe=False)
+                    for ticker in _tickers
+                )
+            )
+            progress.advance(prefetch_task)
 
         wheel_task = progress.add_task(
             "Calculating target positions...",
             total=len(_tickers),
         )
 
+        semaphore = asyncio.Semaphore(MAX_CONCURRENT_WHEELS)
+
+        async def run_wheel(wheel: Wheel) -> Wheel:
+            async with semaphore:
+                return await wheel(
+                    progress, lambda: progress.advance(wheel_task)
+                )
+
         tasks = [
-            Wheel(
-                account_id,
-                ticker,
-                account_summary=account,
-                client=client,
-                positions=positions,
-            )(progress, lambda: progress.advance(wheel_task))
+            run_wheel(
+                Wheel(
+                    account_id,
+                    ticker,
+                    account_summary=account,
+                    client=client,
+                    positions=positions,
+                )
+            )
             for ticker in _tickers.values()
         ]
         results = await asyncio.gather(*tasks)
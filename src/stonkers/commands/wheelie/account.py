@@ -1,7 +1,8 @@
 #
 
 import dataclasses
-from typing import Any, Callable, Optional
+import functools
+from typing import Any, Callable, Dict, Optional
 
 import pandas as pd
 import rich
@@ -37,6 +38,13 @@ class AccountSummary:
         if self._account is None:
             return panel(rich.align.Align.center(self._loading))
 
+        return panel(self._summary)
+
+    # NOTE(jkoelker) The summary only changes when the account is
+    #                re-fetched; cache the built renderable so Live
+    #                refresh ticks reuse it
+    @functools.cached_property
+    def _summary(self) -> rich.table.Table:
         summary = rich.table.Table(
             show_header=False,
             expand=True,
@@ -69,13 +77,13 @@ class AccountSummary:
             number(self.target_buying_power, currency="$"),
         )
 
-        return panel(summary)
+        return summary
 
     def account_get(self, key: str, balance_type: str = "") -> Any:
         if balance_type:
             key = f"{balance_type}.{key}"
 
-        return self.account[key]
+        return self._flat[key]
 
     @property
     def account(self) -> pd.Series:
@@ -84,6 +92,13 @@ class AccountSummary:
 
         return self._account.loc[self.account_id]
 
+    # NOTE(jkoelker) Every property hits account_get and the summary
+    #                reads several per render; a plain dict turns the
+    #                two pandas indexer calls into one hash lookup
+    @functools.cached_property
+    def _flat(self) -> Dict[str, Any]:
+        return self.account.to_dict()
+
     @property
     def target_buying_power(self) -> float:
         return self.net_liquidation * self.margin_usage
@@ -134,4 +149,6 @@ class AccountSummary:
 
     async def __call__(self):
         self._account = await self.client.account(self.account_id)
+        self.__dict__.pop("_flat", None)
+        self.__dict__.pop("_summary", None)
         self._update()
@@ -0,0 +1,30 @@
+#
+
+import asyncio
+import functools
+
+
+# NOTE(jkoelker) The alru_cache(maxsize=1) property stack keys its
+#                cache on self, so concurrent wheels evict each other
+#                and every hit pays the LRU bookkeeping. Caching the
+#                task in a per-instance dict makes a hit one dict get,
+#                and handing back the task (not the result) keeps
+#                concurrent first awaits single-flight
+def cached_awaitable(fn):
+    name = fn.__name__
+
+    @functools.wraps(fn)
+    def wrapper(self):
+        try:
+            return self._acache[name]
+        except AttributeError:
+            self._acache = {}
+        except KeyError:
+            pass
+
+        task = asyncio.ensure_future(fn(self))
+        self._acache[name] = task
+
+        return task
+
+    return property(wrapper)
@@ -1,161 +1,285 @@
 #
 
-from typing import Callable, Dict, Iterable, List, Optional, TypeAlias
+import functools
+from typing import Callable, Dict, Iterable, Optional, Tuple, TypeAlias
 
 import numpy as np
 import pandas as pd
 import tda  # type: ignore
 
-from .price import market_price
-
 ContractType: TypeAlias = tda.client.Client.Options.ContractType
 
+# NOTE(jkoelker) Conditions take the chain DataFrame but compute on the
+#                raw ndarrays, a plain boolean mask skips the Series
+#                allocation and index alignment pandas does per compare
+Condition: TypeAlias = Callable[[pd.DataFrame], np.ndarray]
+
+
+def _market_price(df: pd.DataFrame) -> np.ndarray:
+    """Vectorized `price.market_price` over a chain DataFrame."""
+    bid = df["bid" if "bid" in df.columns else "bidPrice"].to_numpy()
+    ask = df["ask" if "ask" in df.columns else "askPrice"].to_numpy()
+    last = df["last" if "last" in df.columns else "lastPrice"].to_numpy()
+    mark = df["mark"].to_numpy()
+
+    return np.where((bid < last) & (last < ask), last, mark)
+
 
 def _add_rate_of_return(options_df: pd.DataFrame) -> pd.DataFrame:
     """Add the rate of return to the options DataFrame."""
     if "RoR" not in options_df.columns:
-        options_df = options_df.copy()
+        price = _market_price(options_df)
 
-        options_df["marketPrice"] = options_df.apply(market_price, axis=1)
-        options_df["RoR"] = options_df["marketPrice"] / (
-            options_df["strikePrice"] - options_df["marketPrice"]
+        options_df = options_df.assign(
+            marketPrice=price,
+            RoR=price / (options_df["strikePrice"].to_numpy() - price),
         )
     return options_df
 
 
-def rate_of_return(
-    value: float = 0.02,
-) -> Callable[[pd.DataFrame], pd.Series]:
-    def _condition(df: pd.DataFrame) -> pd.Series:
-        df = _add_rate_of_return(df)
-        return df["RoR"] > value
+@functools.lru_cache(maxsize=None)
+def rate_of_return(value: float = 0.02) -> Condition:
+    def _condition(df: pd.DataFrame) -> np.ndarray:
+        if "RoR" in df.columns:
+            return df["RoR"].to_numpy() > value
+
+        price = _market_price(df)
+        return price / (df["strikePrice"].to_numpy() - price) > value
 
     return _condition
 
 
-def minimum_price(
-    value: float = 0.01,
-) -> Callable[[pd.DataFrame], pd.Series]:
-    return lambda df: df["mark"] > value
+@functools.lru_cache(maxsize=None)
+def minimum_price(value: float = 0.01) -> Condition:
+    return lambda df: df["mark"].to_numpy() > value
 
 
-def maximum_price(
-    value: float = 1000.0,
-) -> Callable[[pd.DataFrame], pd.Series]:
-    return lambda df: df["mark"] < value
+@functools.lru_cache(maxsize=None)
+def maximum_price(value: float = 1000.0) -> Condition:
+    return lambda df: df["mark"].to_numpy() < value
 
 
-def open_interest(
-    value: int = 100,
-) -> Callable[[pd.DataFrame], pd.Series]:
-    return lambda df: df["openInterest"] > value
+@functools.lru_cache(maxsize=None)
+def open_interest(value: int = 100) -> Condition:
+    return lambda df: df["openInterest"].to_numpy() > value
 
 
-def total_volume(
-    value: int = 50,
-) -> Callable[[pd.DataFrame], pd.Series]:
-    return lambda df: df["totalVolume"] > value
+@functools.lru_cache(maxsize=None)
+def total_volume(value: int = 50) -> Condition:
+    return lambda df: df["totalVolume"].to_numpy() > value
 
 
+@functools.lru_cache(maxsize=None)
 def days_to_expiration(
     min_days: int = 7,
     max_days: int = 60,
-) -> Callable[[pd.DataFrame], pd.Series]:
-    return lambda df: df["daysToExpiration"].between(min_days, max_days)
+) -> Condition:
+    def _condition(df: pd.DataFrame) -> np.ndarray:
+        days = df["daysToExpiration"].to_numpy()
+        return (days >= min_days) & (days <= max_days)
 
+    return _condition
 
-def spread(
-    value: float = 0.05,
-) -> Callable[[pd.DataFrame], pd.Series]:
-    def _condition(df: pd.DataFrame) -> pd.Series:
-        if "spread" not in df.columns:
-            df = df.copy()
-            df["spread"] = df["ask"] - df["bid"]
 
-        return df["spread"] < value
+@functools.lru_cache(maxsize=None)
+def spread(value: float = 0.05) -> Condition:
+    return lambda df: df["ask"].to_numpy() - df["bid"].to_numpy() < value
 
-    return _condition
 
-
-def exclude_in_the_money() -> Callable[[pd.DataFrame], pd.Series]:
-    return lambda df: ~df["inTheMoney"]
+@functools.lru_cache(maxsize=None)
+def exclude_in_the_money() -> Condition:
+    return lambda df: ~df["inTheMoney"].to_numpy()
 
 
+@functools.lru_cache(maxsize=None)
 def delta(
     target: float = 0.30,
     tolerance: float = 0.05,
     ignore_negative: bool = True,
-) -> Callable[[pd.DataFrame], pd.Series]:
-    return lambda df: pd.Series(
-        np.isclose(
-            df["delta"].abs() if ignore_negative else df["delta"],
-            target,
-            atol=tolerance,
-        ),
-    )
+) -> Condition:
+    def _condition(df: pd.DataFrame) -> np.ndarray:
+        values = df["delta"].to_numpy()
+        if ignore_negative:
+            values = np.abs(values)
 
+        # NOTE(jkoelker) np.isclose drags in rtol scaling and errstate
+        #                handling; the target and tolerance are plain
+        #                scalars so the direct compare is all we need
+        return np.abs(values - target) <= tolerance
+
+    return _condition
 
-def intrinsic_value(
-    min_value: float = 0.0,
-) -> Callable[[pd.DataFrame], pd.Series]:
-    return lambda df: df["intrinsicValue"] >= min_value
 
+@functools.lru_cache(maxsize=None)
+def intrinsic_value(min_value: float = 0.0) -> Condition:
+    return lambda df: df["intrinsicValue"].to_numpy() >= min_value
 
+
+@functools.lru_cache(maxsize=None)
 def liquidity(
     min_bid_size: int = 10,
     min_ask_size: int = 10,
-) -> Callable[[pd.DataFrame], pd.Series]:
-    return lambda df: (df["bidSize"] >= min_bid_size) & (
-        df["askSize"] >= min_ask_size
+) -> Condition:
+    return lambda df: (df["bidSize"].to_numpy() >= min_bid_size) & (
+        df["askSize"].to_numpy() >= min_ask_size
     )
 
 
+@functools.lru_cache(maxsize=None)
 def is_option_type(
     option_type: str | ContractType = ContractType.PUT,
-) -> Callable[[pd.DataFrame], pd.Series]:
+) -> Condition:
     if isinstance(option_type, tda.client.Client.Options.ContractType):
         option_type = option_type.value
 
-    return lambda df: df["putCall"] == option_type
+    def _condition(df: pd.DataFrame) -> np.ndarray:
+        column = df["putCall"]
+
+        # NOTE(jkoelker) Chains dictionary-encode putCall; compare the
+        #                int8 codes rather than re-boxing the strings
+        if isinstance(column.dtype, pd.CategoricalDtype):
+            if option_type not in column.cat.categories:
+                return np.zeros(len(df), dtype=bool)
+
+            code = column.cat.categories.get_loc(option_type)
+            return column.cat.codes.to_numpy() == code
 
+        return column.to_numpy() == option_type
 
-def is_call() -> Callable[[pd.DataFrame], pd.Series]:
+    return _condition
+
+
+@functools.lru_cache(maxsize=None)
+def is_call() -> Condition:
     return is_option_type(tda.client.Client.Options.ContractType.CALL.value)
 
 
-def is_put() -> Callable[[pd.DataFrame], pd.Series]:
+@functools.lru_cache(maxsize=None)
+def is_put() -> Condition:
     return is_option_type(tda.client.Client.Options.ContractType.PUT.value)
 
 
-def combined(
+def combined(df: pd.DataFrame, *conditions: Condition) -> np.ndarray:
+    # NOTE(jkoelker) One reusable mask fused in place, instead of a
+    #                fresh boolean Series per condition plus the `&=`
+    #                alignment merges
+    mask = np.ones(len(df), dtype=bool)
+
+    for condition in conditions:
+        np.logical_and(mask, np.asarray(condition(df)), out=mask)
+
+        # NOTE(jkoelker) Nothing survives, the remaining conditions
+        #                cannot resurrect rows
+        if not mask.any():
+            break
+
+    return mask
+
+
+def _fused_evaluate(
     df: pd.DataFrame,
-    *conditions: Callable[[pd.DataFrame], pd.Series],
-) -> pd.Series:
-    if not conditions:
-        return pd.Series([True] * len(df), index=df.index)
+    min_days: int = 7,
+    max_days: int = 60,
+    spread_value: float = 0.05,
+    delta_target: float = 0.30,
+    delta_tolerance: float = 0.05,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Compute marketPrice, RoR, and the default filter mask in one
+    vectorized pass.
+
+    Equivalent to `_add_rate_of_return` plus `combined(df, *default())`
+    but touches each column exactly once instead of once per
+    condition. The threshold defaults mirror the factory defaults.
+    """
+    bid = df["bid" if "bid" in df.columns else "bidPrice"].to_numpy()
+    ask = df["ask" if "ask" in df.columns else "askPrice"].to_numpy()
+    strike = df["strikePrice"].to_numpy()
+    deltas = df["delta"].to_numpy()
+    days = df["daysToExpiration"].to_numpy()
+    in_the_money = df["inTheMoney"].to_numpy()
+
+    price = _market_price(df)
+    ror = price / (strike - price)
+
+    mask = (
+        (days >= min_days)
+        & (days <= max_days)
+        & (ask - bid < spread_value)
+        & ~in_the_money
+        & (np.abs(np.abs(deltas) - delta_target) <= delta_tolerance)
+    )
+
+    return price, ror, mask
+
+
+@functools.lru_cache(maxsize=None)
+def make_filter(
+    min_days: Optional[int] = 7,
+    max_days: Optional[int] = 60,
+    spread_value: Optional[float] = 0.05,
+    delta_target: Optional[float] = 0.30,
+    delta_tolerance: float = 0.05,
+    exclude_itm: bool = True,
+    option_type: Optional[str | ContractType] = None,
+) -> Condition:
+    """Build one specialized condition for a whole threshold tuple.
+
+    The returned closure computes the entire mask in a single pass
+    over the raw arrays, and is memoized per parameter tuple so every
+    wheel sharing a config reuses the same specialization. `None`
+    disables the corresponding clause at build time instead of
+    branching per call.
+    """
+    if isinstance(option_type, tda.client.Client.Options.ContractType):
+        option_type = option_type.value
 
-    _combined = conditions[0](df)
+    def _condition(df: pd.DataFrame) -> np.ndarray:
+        mask = np.ones(len(df), dtype=bool)
 
-    for condition in conditions[1:]:
-        _combined &= condition(df)
+        if min_days is not None or max_days is not None:
+            days = df["daysToExpiration"].to_numpy()
 
-    return _combined
+            if min_days is not None:
+                mask &= days >= min_days
 
+            if max_days is not None:
+                mask &= days <= max_days
 
-def default() -> List[Callable[[pd.DataFrame], pd.Series]]:
-    return [
+        if exclude_itm:
+            mask &= ~df["inTheMoney"].to_numpy()
+
+        if delta_target is not None:
+            mask &= (
+                np.abs(np.abs(df["delta"].to_numpy()) - delta_target)
+                <= delta_tolerance
+            )
+
+        if spread_value is not None:
+            mask &= df["ask"].to_numpy() - df["bid"].to_numpy() < spread_value
+
+        if option_type is not None:
+            mask &= is_option_type(option_type)(df)
+
+        return mask
+
+    return _condition
+
+
+@functools.lru_cache(maxsize=1)
+def default() -> Tuple[Condition, ...]:
+    # NOTE(jkoelker) Most selective and cheapest first, so an early
+    #                all-False mask short-circuits the rest
+    return (
         days_to_expiration(),
-        spread(),
         exclude_in_the_money(),
         delta(),
-    ]
+        spread(),
+    )
 
 
 def evaluate(
     options_df: pd.DataFrame,
-    filter_conditions: Optional[
-        Iterable[Callable[[pd.DataFrame], pd.Series]]
-    ] = None,
+    filter_conditions: Optional[Iterable[Condition]] = None,
     order_by: Optional[Dict[str, bool]] = None,
 ) -> pd.DataFrame:
     """Evaluate options using the provided pandas DataFrame keys."""
@@ -163,38 +287,74 @@ def evaluate(
     if options_df.empty:
         return options_df
 
-    # Copy the dataframe to avoid modifying the original one
-    options_df = options_df.copy()
-
     if filter_conditions is None:
-        filter_conditions = default()
+        # NOTE(jkoelker) The default conditions are known up front, so
+        #                fuse price, RoR, and the mask into one pass
+        price, ror, condition = _fused_evaluate(options_df)
+        selected = np.flatnonzero(condition)
+
+        result = options_df.iloc[selected].assign(
+            marketPrice=price[selected], RoR=ror[selected]
+        )
 
-    options_df = _add_rate_of_return(options_df)
+    else:
+        condition = combined(options_df, *filter_conditions)
+        selected = np.flatnonzero(condition)
 
-    # Apply the default filter conditions
-    condition = combined(options_df, *filter_conditions)
+        # NOTE(jkoelker) RoR is derived on the survivors only; the full
+        #                chain is never copied
+        result = _add_rate_of_return(options_df.iloc[selected])
 
     if order_by is None:
         order_by = {"RoR": False, "expirationDate": True}
 
     valid_order_by = {
-        key: order_by[key] for key in order_by if key in options_df.columns
+        key: order_by[key] for key in order_by if key in result.columns
     }
 
-    return options_df[condition].sort_values(
+    return result.sort_values(
         by=list(valid_order_by.keys()), ascending=list(valid_order_by.values())
     )
 
 
 def best(
     options_df: pd.DataFrame,
-    filter_conditions: Optional[
-        Iterable[Callable[[pd.DataFrame], pd.Series]]
-    ] = None,
+    filter_conditions: Optional[Iterable[Condition]] = None,
     order_by: Optional[Dict[str, bool]] = None,
 ) -> Optional[pd.Series]:
     """Retrieve the best option based on the evaluation criteria."""
-    evaluated_df = evaluate(
-        options_df, filter_conditions=filter_conditions, order_by=order_by
-    )
-    return evaluated_df.iloc[0] if not evaluated_df.empty else None
+    if order_by is not None:
+        # A custom ordering needs the full sort
+        evaluated_df = evaluate(
+            options_df, filter_conditions=filter_conditions, order_by=order_by
+        )
+        return evaluated_df.iloc[0] if not evaluated_df.empty else None
+
+    if options_df.empty:
+        return None
+
+    # NOTE(jkoelker) Top-1 by RoR only needs an argmax over the
+    #                survivors, not a sorted copy of them
+    if filter_conditions is None:
+        price, ror, mask = _fused_evaluate(options_df)
+        selected = np.flatnonzero(mask)
+
+        if not selected.size:
+            return None
+
+        winner = selected[np.argmax(ror[selected])]
+
+        row = options_df.iloc[winner].copy()
+        row["marketPrice"] = price[winner]
+        row["RoR"] = ror[winner]
+
+        return row
+
+    selected = np.flatnonzero(combined(options_df, *filter_conditions))
+
+    if not selected.size:
+        return None
+
+    survivors = _add_rate_of_return(options_df.iloc[selected])
+
+    return survivors.iloc[int(np.argmax(survivors["RoR"].to_numpy()))]
@@ -2,9 +2,7 @@
 
 import dataclasses
 import functools
-from typing import Any, Callable, Dict, List, get_type_hints
-
-import pandas as pd
+from typing import Any, Dict, List, get_type_hints
 
 from . import conditions
 
@@ -73,7 +71,7 @@ class WheelConfig:
         )
 
     @functools.cached_property
-    def conditions(self) -> List[Callable[[pd.DataFrame], pd.Series]]:
+    def conditions(self) -> "List[conditions.Condition]":
         return [
             conditions.days_to_expiration(min_days=7, max_days=65),
             conditions.exclude_in_the_money(),
@@ -81,15 +79,27 @@ class WheelConfig:
         ]
 
     @functools.cached_property
-    def call_conditions(self) -> List[Callable[[pd.DataFrame], pd.Series]]:
-        return self.conditions + [
-            conditions.is_call(),
+    def call_conditions(self) -> "List[conditions.Condition]":
+        # NOTE(jkoelker) One memoized specialization of the whole
+        #                threshold tuple instead of a closure per clause
+        return [
+            conditions.make_filter(
+                min_days=7,
+                max_days=65,
+                spread_value=None,
+                option_type=conditions.ContractType.CALL,
+            ),
         ]
 
     @functools.cached_property
-    def put_conditions(self) -> List[Callable[[pd.DataFrame], pd.Series]]:
-        return self.conditions + [
-            conditions.is_put(),
+    def put_conditions(self) -> "List[conditions.Condition]":
+        return [
+            conditions.make_filter(
+                min_days=7,
+                max_days=65,
+                spread_value=None,
+                option_type=conditions.ContractType.PUT,
+            ),
         ]
 
     @classmethod
@@ -1,6 +1,7 @@
 #
 
-from typing import Optional
+import functools
+from typing import Callable, Optional
 
 
 def titlize(text: str) -> str:
@@ -18,6 +19,42 @@ def colorize(text: str, color: str = "green", bold: bool = False) -> str:
     return f"[{color}]{text}[/{color}]"
 
 
+# NOTE(jkoelker) Every table cell of every Live tick goes through
+#                number(); specialize the static parts (format spec,
+#                prefix/suffix, markup tags) once per configuration so
+#                the per-call work is a single format plus a join
+@functools.lru_cache(maxsize=64)
+def _number_formatter(
+    precision: int,
+    percent: bool,
+    currency: str,
+    bold: bool,
+) -> Callable[[float, str], str]:
+    spec = f",.{precision}f"
+    post = "%" if percent else ""
+    open_tag = "[bold]" if bold else ""
+    close_tag = "[/bold]" if bold else ""
+
+    def _format(value: float, color: str) -> str:
+        value_str = format(value, spec)
+
+        if precision > 2:
+            # NOTE(jkoelker) Remove all trailing zeros.
+            value_str = value_str.rstrip("0")
+
+            # NOTE(jkoelker) If the last character is a decimal point,
+            # pad up to 2 decimal places with zeros.
+            while len(value_str.split(".")[-1]) < 2:
+                value_str += "0"
+
+        return (
+            f"[{color}]{open_tag}{currency}{value_str}{post}"
+            f"{close_tag}[/{color}]"
+        )
+
+    return _format
+
+
 def number(
     value: float | str,
     precision: int = 2,
@@ -31,26 +68,10 @@ def number(
 
     _color = color if color else "green" if value >= 0 else "red"
 
-    def fmt(value: float, pre: str = "", post: str = "") -> str:
-        value_str = f"{value:,.{precision}f}"
-
-        if precision > 2:
-            # NOTE(jkoelker) Remove all trailing zeros.
-            value_str = value_str.rstrip("0")
-
-            # NOTE(jkoelker) If the last character is a decimal point,
-            # pad up to 2 decimal places with zeros.
-            while len(value_str.split(".")[-1]) < 2:
-                value_str += "0"
-
-        return colorize(f"{pre}{value_str}{post}", color=_color, bold=bold)
-
     if percent:
         value *= 100
 
-    return fmt(
-        value, pre=currency if currency else "", post="%" if percent else ""
-    )
+    return _number_formatter(precision, percent, currency, bold)(value, _color)
 
 
 def join(*args: str, sep: str = " ") -> str:
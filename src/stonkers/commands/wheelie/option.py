@@ -1,7 +1,6 @@
 #
 
 import dataclasses
-import functools
 
 import pandas as pd
 import rich
@@ -20,59 +19,34 @@ class Option:
     ticker: str
     num_contracts: int = 0
 
-    @functools.cached_property
-    def delta(self) -> float:
-        return self.data["delta"]
-
-    @functools.cached_property
-    def expiration_date(self) -> str:
-        if "expirationDate" not in self.data:
-            return ""
-
-        date = self.data["expirationDate"]
-        if not isinstance(date, pd.Timestamp):
+    # NOTE(jkoelker) Scalar reads off a pd.Series go through the full
+    #                indexing machinery; one to_dict() up front
+    #                amortizes them all into plain attribute access
+    def __post_init__(self) -> None:
+        data = self.data.to_dict()
+
+        # NOTE(jkoelker) Normalize the contract side once; every
+        #                derived field reads the canonical form
+        put_call = str(data["putCall"]).upper()
+
+        self.delta: float = data["delta"]
+        self.is_call: bool = put_call == "CALL"
+        self.is_put: bool = put_call == "PUT"
+        self.multiplier: int = data["multiplier"]
+        self.price: float = market_price(self.data)
+        self.put_call: str = put_call.title()
+        self.return_on_risk: float = data["RoR"]
+        self.strike_price: float = data["strikePrice"]
+        self.symbol: str = data["symbol"]
+        self.underlying: str = data.get("underlying", self.ticker)
+
+        date = data.get("expirationDate")
+        if date is not None and not isinstance(date, pd.Timestamp):
             date = pd.Timestamp(date)
 
-        return date.strftime("%b %d %Y")
-
-    @functools.cached_property
-    def is_call(self) -> bool:
-        return self.data["putCall"].lower() == "call"
-
-    @functools.cached_property
-    def is_put(self) -> bool:
-        return self.data["putCall"].lower() == "put"
-
-    @functools.cached_property
-    def multiplier(self) -> int:
-        return self.data["multiplier"]
-
-    @functools.cached_property
-    def return_on_risk(self) -> float:
-        return self.data["RoR"]
-
-    @functools.cached_property
-    def strike_price(self) -> float:
-        return self.data["strikePrice"]
-
-    @functools.cached_property
-    def price(self) -> float:
-        return market_price(self.data)
-
-    @functools.cached_property
-    def put_call(self) -> str:
-        return self.data["putCall"].title()
-
-    @functools.cached_property
-    def symbol(self) -> str:
-        return self.data["symbol"]
-
-    @functools.cached_property
-    def underlying(self) -> str:
-        if "underlying" in self.data:
-            return self.data["underlying"]
-
-        return self.ticker
+        self.expiration_date: str = (
+            date.strftime("%b %d %Y") if date is not None else ""
+        )
 
     def __rich__(self) -> rich.console.RenderableType:
         if self.num_contracts == 0:
@@ -1,8 +1,10 @@
 #
 
 import dataclasses
-from typing import Callable, Iterable, Optional
+import functools
+from typing import Callable, Dict, FrozenSet, Iterable, Optional, Tuple
 
+import numpy as np
 import pandas as pd
 import rich
 import rich.align
@@ -15,7 +17,7 @@ import rich.table
 from stonkers.client import Client
 
 from .formatting import number
-from .price import market_price
+from .price import market_prices
 
 
 @dataclasses.dataclass
@@ -37,12 +39,19 @@ class Positions:
         if self._is_loading:
             return panel(rich.align.Align.center(self._loading))
 
+        return panel(self._table)
+
+    # NOTE(jkoelker) The table only changes when new positions land;
+    #                cache the built renderable so Live refresh ticks
+    #                reuse it instead of re-adding every row
+    @functools.cached_property
+    def _table(self) -> rich.table.Table:
         table = rich.table.Table(
             expand=True,
         )
 
         if self.positions.empty or self.quotes.empty:
-            return panel(table)
+            return table
 
         table.add_column("Symbol")
         table.add_column("R")
@@ -58,85 +67,50 @@ class Positions:
         table.add_column("DTE", justify="right")
         table.add_column("ITM?")
 
-        def cost_basis(row: pd.Series) -> float:
-            quantity = row["longQuantity"] - row["shortQuantity"]
-            value = row["averagePrice"] * quantity
-
-            if row["assetType"] == "OPTION":
-                value = value * 100
-
-            return value
-
-        def is_in_the_money(
-            underlying_price: float,
-            row: pd.Series,
-        ) -> bool:
-            if row["assetType"] != "OPTION":
-                return False
-
-            if row["contract_type"] == "CALL":
-                return row["strike"] < underlying_price
-
-            return row["strike"] > underlying_price
-
-        def render_position(symbol: str, pos: pd.Series, underlying: str):
+        def render_position(symbol: str, pos: pd.Series):
             right = (
                 "S"
                 if pos["assetType"] == "EQUITY"
                 else pos["contract_type"][0]
             )
-            mark = market_price(self.quotes.loc[symbol])
-            cost = cost_basis(pos)
-            profit = pos["marketValue"] - cost
-            profit_percent = profit / abs(cost)
-
             row = [
                 "",
                 right,
                 number(
                     pos["longQuantity"] - pos["shortQuantity"], precision=0
                 ),
-                number(mark, currency="$", precision=5),
+                number(pos["_mark"], currency="$", precision=5),
                 number(pos["averagePrice"], currency="$", precision=5),
                 number(pos["marketValue"], currency="$", precision=5),
-                number(cost, currency="$", precision=5),
-                number(profit, currency="$", precision=5),
-                number(profit_percent, percent=True, precision=2),
+                number(pos["_cost"], currency="$", precision=5),
+                number(pos["_profit"], currency="$", precision=5),
+                number(pos["_profit_pct"], percent=True, precision=2),
             ]
 
             if pos["assetType"] == "OPTION":
-                underlying_price = market_price(self.quotes.loc[underlying])
-
-                dte = pos["expiration_date"] - pd.Timestamp.now()
                 row += (
                     number(pos["strike"], currency="$", precision=5),
                     pos["expiration_date"].strftime("%Y-%m-%d"),
-                    number(dte.days, precision=0),
-                    ":heavy_check_mark:"
-                    if is_in_the_money(underlying_price, pos)
-                    else "",
+                    number(pos["_dte"], precision=0),
+                    ":heavy_check_mark:" if pos["_itm"] else "",
                 )
 
             table.add_row(*row)
 
         show_tickers = set(self.tickers)
 
-        for ticker in self.positions.index.get_level_values(
-            "underlying"
-        ).unique():
+        for ticker, positions in self._render_groups.items():
             if ticker not in show_tickers:
                 continue
 
-            positions = self.positions.loc[ticker]
-
             table.add_row(ticker)
 
             for symbol, pos in positions.iterrows():
-                render_position(symbol, pos, underlying=ticker)
+                render_position(symbol, pos)
 
             table.add_section()
 
-        return panel(table)
+        return table
 
     def _update(self):
         if self.update is not None:
@@ -185,11 +159,14 @@ class Positions:
             == 0
         ]
 
-    @property
+    # NOTE(jkoelker) Everything downstream (lookup dicts, render
+    #                groups, share counts) chains through these views;
+    #                build each boolean-mask slice once per load
+    @functools.cached_property
     def equities(self) -> pd.DataFrame:
         return self.positions[self.positions["assetType"] == "EQUITY"]
 
-    @property
+    @functools.cached_property
     def options(self) -> pd.DataFrame:
         return self.positions[self.positions["assetType"] == "OPTION"]
 
@@ -207,16 +184,95 @@ class Positions:
 
         return self._quotes
 
+    # NOTE(jkoelker) The wheel asks about every ticker up to several
+    #                times; membership sets make those lookups O(1)
+    #                instead of scanning the index level per call
+    @functools.cached_property
+    def _equity_underlyings(self) -> FrozenSet[str]:
+        return frozenset(self.equities.index.get_level_values("underlying"))
+
+    # NOTE(jkoelker) Derive the render-only columns in one vectorized
+    #                pass instead of computing cost basis, market
+    #                price, and moneyness per row inside iterrows()
+    @functools.cached_property
+    def _render_frame(self) -> pd.DataFrame:
+        positions = self.positions
+        marks = market_prices(self.quotes)
+
+        is_option = positions["assetType"].to_numpy() == "OPTION"
+
+        quantity = (
+            positions["longQuantity"].to_numpy()
+            - positions["shortQuantity"].to_numpy()
+        )
+        cost = positions["averagePrice"].to_numpy() * quantity
+        cost = np.where(is_option, cost * 100, cost)
+
+        strike = pd.to_numeric(positions["strike"], errors="coerce").to_numpy()
+        contract_type = positions["contract_type"].to_numpy()
+        underlying_marks = marks.reindex(
+            positions.index.get_level_values("underlying")
+        ).to_numpy()
+
+        in_the_money = is_option & (
+            ((contract_type == "CALL") & (strike < underlying_marks))
+            | ((contract_type == "PUT") & (strike > underlying_marks))
+        )
+
+        # NOTE(jkoelker) One clock read and one vectorized subtraction
+        #                for the whole expiration column, instead of a
+        #                Timestamp.now() and a Timedelta per row
+        days_to_expiration = (
+            positions["expiration_date"] - pd.Timestamp.now()
+        ).dt.days
+
+        profit = positions["marketValue"].to_numpy() - cost
+
+        return positions.assign(
+            _mark=marks.reindex(
+                positions.index.get_level_values("symbol")
+            ).to_numpy(),
+            _cost=cost,
+            _dte=days_to_expiration.to_numpy(),
+            _itm=in_the_money,
+            _profit=profit,
+            _profit_pct=profit / np.abs(cost),
+        )
+
+    # NOTE(jkoelker) Live re-renders __rich__ several times a second;
+    #                deriving the underlying level and slicing the
+    #                frame per ticker on every tick adds up, so split
+    #                the frame once per load
+    @functools.cached_property
+    def _render_groups(self) -> Dict[str, pd.DataFrame]:
+        return {
+            ticker: group.droplevel("underlying")
+            for ticker, group in self._render_frame.groupby(
+                level="underlying", sort=False
+            )
+        }
+
+    # NOTE(jkoelker) One groupby splits the options frame into
+    #                per-(underlying, contract type) slices up front;
+    #                every calls()/puts() lookup afterwards is a dict
+    #                get instead of a MultiIndex slice plus a boolean
+    #                filter
+    @functools.cached_property
+    def _option_groups(self) -> Dict[Tuple[str, str], pd.DataFrame]:
+        return dict(
+            iter(
+                self.options.groupby(
+                    ["underlying", "contract_type"], observed=True
+                )
+            )
+        )
+
     def _get_option_positions(
         self,
         ticker: str,
         contract_type: str,
     ) -> Optional[pd.DataFrame]:
-        if ticker not in self.options.index.get_level_values("underlying"):
-            return None
-
-        positions = self.options.loc[[ticker]]
-        return positions[positions["contract_type"] == contract_type]
+        return self._option_groups.get((ticker, contract_type))
 
     def calls(self, ticker: str) -> Optional[pd.DataFrame]:
         return self._get_option_positions(ticker, "CALL")
@@ -225,19 +281,81 @@ class Positions:
         return self._get_option_positions(ticker, "PUT")
 
     def shares(self, ticker: str) -> Optional[pd.DataFrame]:
-        if ticker not in self.equities.index.get_level_values("underlying"):
+        if ticker not in self._equity_underlyings:
             return None
 
         return self.equities.loc[[ticker]]
 
-    async def __call__(self, client: Client, account_id: str):
+    # NOTE(jkoelker) Net share counts, summed once for every
+    #                underlying; share_count() is then a dict get
+    #                instead of a label lookup plus two column sums
+    @functools.cached_property
+    def _equity_quantities(self) -> Dict[str, float]:
+        equities = self.equities
+        quantity = equities["longQuantity"] - equities["shortQuantity"]
+
+        return quantity.groupby(level="underlying").sum().to_dict()
+
+    def share_count(self, ticker: str) -> int:
+        return int(abs(self._equity_quantities.get(ticker, 0)))
+
+    # NOTE(jkoelker) Net contract counts per (underlying, side),
+    #                summed once per load; the per-wheel num_calls
+    #                and num_puts reads become dict gets instead of
+    #                slicing a frame and summing two columns each
+    @functools.cached_property
+    def _option_quantities(self) -> Dict[Tuple[str, str], float]:
+        options = self.options
+        quantity = options["longQuantity"] - options["shortQuantity"]
+
+        return (
+            quantity.groupby(
+                [
+                    options.index.get_level_values("underlying"),
+                    options["contract_type"],
+                ],
+                observed=True,
+            )
+            .sum()
+            .to_dict()
+        )
+
+    def call_count(self, ticker: str) -> int:
+        return int(abs(self._option_quantities.get((ticker, "CALL"), 0)))
+
+    def put_count(self, ticker: str) -> int:
+        return int(abs(self._option_quantities.get((ticker, "PUT"), 0)))
+
+    async def __call__(
+        self,
+        client: Client,
+        account_id: str,
+        extra_symbols: Optional[Iterable[str]] = None,
+    ):
         positions = await client.positions(account_id)
 
         if positions is None or positions.empty:
+            # NOTE(jkoelker) Still warm the quote cache for the
+            #                configured tickers so the wheels never
+            #                block on per-symbol fetches
+            if extra_symbols:
+                await client.quote(extra_symbols)
+
             self._is_loading = False
             return
 
-        positions.set_index(["underlying", positions.index], inplace=True)
+        # NOTE(jkoelker) Two fixed values; sorting the int8 category
+        #                codes beats comparing the strings per row
+        positions["contract_type"] = positions["contract_type"].astype(
+            pd.CategoricalDtype(["CALL", "PUT"], ordered=True)
+        )
+
+        # NOTE(jkoelker) Build the MultiIndex from the arrays directly
+        #                instead of round-tripping through set_index
+        positions.index = pd.MultiIndex.from_arrays(
+            [positions.pop("underlying").to_numpy(), positions.index],
+            names=["underlying", "symbol"],
+        )
 
         # sort by underlying, then by expiration_date
         positions.sort_values(
@@ -248,11 +366,32 @@ class Positions:
 
         self._positions = positions
 
-        symbols = positions.index.get_level_values("symbol").tolist()
-        underlying = positions.index.get_level_values("underlying").tolist()
-        tickers = set(symbols + underlying)
+        # NOTE(jkoelker) Drop any lookup caches computed while empty
+        self.__dict__.pop("equities", None)
+        self.__dict__.pop("options", None)
+        self.__dict__.pop("_equity_underlyings", None)
+        self.__dict__.pop("_equity_quantities", None)
+        self.__dict__.pop("_option_groups", None)
+        self.__dict__.pop("_option_quantities", None)
+        self.__dict__.pop("_render_frame", None)
+        self.__dict__.pop("_render_groups", None)
+        self.__dict__.pop("_table", None)
+
+        # NOTE(jkoelker) One sorted unique union in NumPy, instead of
+        #                materializing both levels as Python lists and
+        #                hashing every string into a set
+        tickers = np.union1d(
+            positions.index.get_level_values("symbol"),
+            positions.index.get_level_values("underlying"),
+        )
+
+        # NOTE(jkoelker) Fold any caller-supplied symbols into the one
+        #                batched quote call instead of paying a second
+        #                round trip to prefetch them separately
+        if extra_symbols is not None:
+            tickers = np.union1d(tickers, list(extra_symbols))
 
-        self._quotes = await client.quote(tickers)
+        self._quotes = await client.quote(tickers.tolist())
 
         self._is_loading = False
 
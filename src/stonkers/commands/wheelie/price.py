@@ -1,8 +1,24 @@
 #
 
+import numpy as np
 import pandas as pd
 
 
+def market_prices(quotes: pd.DataFrame) -> pd.Series:
+    """Vectorized `market_price` over a whole quotes DataFrame."""
+    bid = quotes["bid" if "bid" in quotes.columns else "bidPrice"].to_numpy()
+    ask = quotes["ask" if "ask" in quotes.columns else "askPrice"].to_numpy()
+    last = quotes[
+        "last" if "last" in quotes.columns else "lastPrice"
+    ].to_numpy()
+    mark = quotes["mark"].to_numpy()
+
+    return pd.Series(
+        np.where((bid < last) & (last < ask), last, mark),
+        index=quotes.index,
+    )
+
+
 def market_price(quote: pd.Series) -> float:
     bid = "bidPrice"
     ask = "askPrice"
@@ -1,8 +1,9 @@
 #
 
+import asyncio
 import dataclasses
 import functools
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 import async_lru as alru
 import numpy as np
@@ -13,6 +14,7 @@ import rich.progress
 import rich.table
 from stonkers.client import Client
 
+from .caching import cached_awaitable
 from .option import Option
 from .positions import Positions
 from .price import market_price
@@ -23,8 +25,27 @@ def count_positions(positions: Optional[pd.DataFrame]) -> int:
     if positions is None or positions.empty:
         return 0
 
-    return np.abs(
-        positions["longQuantity"].sum() - positions["shortQuantity"].sum()
+    quantity = (
+        positions["longQuantity"].to_numpy()
+        - positions["shortQuantity"].to_numpy()
+    )
+
+    # NOTE(jkoelker) Plain int so downstream compares skip numpy
+    #                scalar dispatch
+    return int(abs(quantity.sum()))
+
+
+# NOTE(jkoelker) Order legs are lists of dicts in an object column;
+#                a generator over the raw array beats apply, which
+#                builds a Series per row just to call the lambda
+def _legs_mask(
+    orders: pd.DataFrame,
+    predicate: Callable[[list], bool],
+) -> np.ndarray:
+    legs = orders["orderLegCollection"].to_numpy()
+
+    return np.fromiter(
+        (predicate(leg) for leg in legs), dtype=bool, count=len(legs)
     )
 
 
@@ -33,8 +54,9 @@ def filter_instruction(orders: pd.DataFrame, instruction: str) -> pd.DataFrame:
         return orders
 
     return orders[
-        orders["orderLegCollection"].apply(
-            lambda x: len(x) == 1 and x[0]["instruction"] == instruction
+        _legs_mask(
+            orders,
+            lambda x: len(x) == 1 and x[0]["instruction"] == instruction,
         )
     ]
 
@@ -62,8 +84,7 @@ class Ticker:
             self.account_id == other.account_id and self.ticker == other.ticker
         )
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def history(self) -> pd.DataFrame:
         start_datetime = pd.Timestamp.now() - pd.Timedelta(
             days=self.history_days
@@ -72,8 +93,7 @@ class Ticker:
             self.ticker, start_datetime
         )
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def quote(self) -> pd.Series:
         return (await self.client.quote(self.ticker)).loc[self.ticker]
 
@@ -84,13 +104,11 @@ class Ticker:
 
         return self.positions.calls(self.ticker)
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def change(self) -> float:
         return np.fabs(await self.price - await self.close)
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def close(self) -> float:
         if await self.client.is_equities_open:
             # If the market is not open, use the close from two days ago
@@ -98,22 +116,30 @@ class Ticker:
 
         return (await self.quote)["closePrice"]
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def price(self) -> float:
         return market_price(await self.quote)
 
     @functools.cached_property
     def num_calls(self) -> int:
-        return count_positions(self.calls)
+        if self.positions is None:
+            return 0
+
+        return self.positions.call_count(self.ticker)
 
     @functools.cached_property
     def num_puts(self) -> int:
-        return count_positions(self.puts)
+        if self.positions is None:
+            return 0
+
+        return self.positions.put_count(self.ticker)
 
     @functools.cached_property
     def num_shares(self) -> int:
-        return count_positions(self.shares)
+        if self.positions is None:
+            return 0
+
+        return self.positions.share_count(self.ticker)
 
     @functools.cached_property
     def puts(self) -> Optional[pd.DataFrame]:
@@ -129,30 +155,38 @@ class Ticker:
 
         return self.positions.shares(self.ticker)
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def orders(self) -> pd.DataFrame:
         orders = await self.client.orders(self.account_id)
 
+        if orders.empty:
+            return orders
+
         return orders[
-            orders["orderLegCollection"].apply(
+            _legs_mask(
+                orders,
                 lambda x: len(x) == 1
-                and x[0]["instrument"]["underlyingSymbol"] == self.ticker
+                and x[0]["instrument"]["underlyingSymbol"] == self.ticker,
             )
         ]
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def had_order_today(self) -> bool:
-        orders = pd.concat([await self.open_orders, await self.filled_orders])
+        # NOTE(jkoelker) Only the latest timestamp matters; take the
+        #                max of each frame instead of concatenating
+        #                them into a throwaway copy
+        latest = [
+            orders["enteredTime"].max()
+            for orders in (await self.open_orders, await self.filled_orders)
+            if not orders.empty
+        ]
 
-        if orders.empty:
+        if not latest:
             return False
 
-        return orders["enteredTime"].max().date() == pd.Timestamp.now().date()
+        return max(latest).date() == pd.Timestamp.now().date()
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def open_orders(self) -> pd.DataFrame:
         orders = await self.orders
 
@@ -161,8 +195,7 @@ class Ticker:
 
         return orders[orders["status"].isin(["WORKING", "QUEUED"])]
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def filled_orders(self) -> pd.DataFrame:
         orders = await self.orders
 
@@ -171,8 +204,7 @@ class Ticker:
 
         return orders[orders["status"] == "FILLED"]
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def open_sell_to_open_orders(self) -> pd.DataFrame:
         orders = await self.open_orders
 
@@ -181,8 +213,7 @@ class Ticker:
             self.client.OrderBuilder.OptionInstruction.SELL_TO_OPEN,
         )
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def open_buy_to_close_orders(self) -> pd.DataFrame:
         orders = await self.open_orders
 
@@ -191,8 +222,7 @@ class Ticker:
             self.client.OrderBuilder.OptionInstruction.BUY_TO_CLOSE,
         )
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def filled_sell_to_open_orders(self) -> pd.DataFrame:
         orders = await self.filled_orders
 
@@ -201,8 +231,7 @@ class Ticker:
             self.client.OrderBuilder.OptionInstruction.SELL_TO_OPEN,
         )
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def filled_buy_to_close_orders(self) -> pd.DataFrame:
         orders = await self.filled_orders
 
@@ -211,24 +240,42 @@ class Ticker:
             self.client.OrderBuilder.OptionInstruction.BUY_TO_CLOSE,
         )
 
-    @alru.alru_cache
-    async def existing_order(self, option: Option) -> Optional[pd.Series]:
+    # NOTE(jkoelker) One pass over the open orders builds a hash
+    #                index; each candidate option is then a dict get
+    #                instead of its own scan over the legs
+    @cached_awaitable
+    async def _open_order_index(self) -> dict:
         orders = await self.open_orders
 
+        index: dict = {}
+
         if orders.empty:
-            return None
+            return index
+
+        for _, row in orders.iterrows():
+            legs = row["orderLegCollection"]
+
+            if len(legs) != 1:
+                continue
 
-        def needle(x: pd.Series) -> bool:
-            return (
-                x["orderLegCollection"][0]["instrument"]["symbol"]
-                == option.symbol
-                and x["orderLegCollection"][0]["instruction"]
-                == self.client.OrderBuilder.OptionInstruction.SELL_TO_OPEN
-                and x["orderLegCollection"][0]["putCall"].lower()
-                == option.put_call.lower()
+            key = (
+                legs[0]["instrument"]["symbol"],
+                legs[0]["instruction"],
+                legs[0]["putCall"].lower(),
             )
+            index.setdefault(key, row)
 
-        return orders[orders["orderLegCollection"].apply(needle)].iloc[0]
+        return index
+
+    @alru.alru_cache
+    async def existing_order(self, option: Option) -> Optional[pd.Series]:
+        key = (
+            option.symbol,
+            self.client.OrderBuilder.OptionInstruction.SELL_TO_OPEN,
+            option.put_call.lower(),
+        )
+
+        return (await self._open_order_index).get(key)
 
     async def has_existing_order(self, option: Option) -> bool:
         existing_order = await self.existing_order(option)
@@ -248,14 +295,19 @@ class Ticker:
     ) -> "Ticker":
         add_tasks(progress, task, 3)
 
-        # Preload the history and the quote
-        await self.history
-        progress.advance(task)
+        async def advance(awaitable: Any) -> Any:
+            result = await awaitable
+            progress.advance(task)
 
-        await self.quote
-        progress.advance(task)
+            return result
 
-        await self.orders
-        progress.advance(task)
+        # NOTE(jkoelker) Preload the history, quote, and orders in
+        #                parallel; they are independent requests so
+        #                the warm-up costs one round trip, not three
+        await asyncio.gather(
+            advance(self.history),
+            advance(self.quote),
+            advance(self.orders),
+        )
 
         return self
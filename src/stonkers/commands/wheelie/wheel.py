@@ -3,10 +3,11 @@
 import asyncio
 import dataclasses
 import functools
+import math
 from typing import Any, Callable, List, Optional
 
-import async_lru as alru
 import numpy as np
+import pandas as pd
 import rich
 import rich.console
 import rich.progress
@@ -15,6 +16,7 @@ from stonkers.client import Client
 
 from . import conditions
 from .account import AccountSummary
+from .caching import cached_awaitable
 from .config import WheelConfig
 from .formatting import colorize, join, number
 from .option import Option
@@ -40,7 +42,25 @@ class Wheel:
 
     options: List[Option] = dataclasses.field(default_factory=list)
 
+    _hash: int = dataclasses.field(
+        default=0, init=False, repr=False, compare=False
+    )
+
     def __post_init__(self) -> None:
+        # NOTE(jkoelker) Wheels key the alru caches, so __hash__ runs
+        #                on every cached await; account_id and config
+        #                never change after init, so hash them once
+        self._hash = hash((self.account_id, self.config))
+
+        # NOTE(jkoelker) Flatten the hot config reads; one attribute
+        #                hop instead of two on every property access.
+        #                The config is immutable once the wheel spins
+        self._sigma = self.config.sigma
+        self._weight = self.config.weight
+        self._max_contracts_percent = self.config.max_contracts_percent
+        self._call_conditions = self.config.call_conditions
+        self._put_conditions = self.config.put_conditions
+
         self._ticker = Ticker(
             self.account_id,
             self.client,
@@ -50,7 +70,7 @@ class Wheel:
         )
 
     def __hash__(self) -> int:
-        return hash((self.account_id, self.config))
+        return self._hash
 
     def __eq__(self, other: Any) -> bool:
         if not isinstance(other, Wheel):
@@ -79,28 +99,25 @@ class Wheel:
     def ticker(self) -> str:
         return self.config.ticker
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def is_red(self) -> bool:
         return await self._ticker.price < await self._ticker.close
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def is_green(self) -> bool:
         return await self._ticker.price > await self._ticker.close
 
     @functools.cached_property
     def excess_calls(self) -> int:
         if self.has_excess_calls:
-            return np.abs(self.net_target_calls)
+            return abs(self.net_target_calls)
 
         return 0
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def excess_puts(self) -> int:
         if await self.has_excess_puts:
-            return np.abs(await self.net_target_puts)
+            return abs(await self.net_target_puts)
 
         return 0
 
@@ -108,58 +125,44 @@ class Wheel:
     def has_excess_calls(self) -> bool:
         return self.net_target_calls < 0
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def has_excess_puts(self) -> bool:
         return await self.net_target_puts < 0
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def maximum_new_contracts(self) -> int:
-        buying_power = (
-            self.target_buying_power * self.config.max_contracts_percent
-        )
+        buying_power = self.target_buying_power * self._max_contracts_percent
         return max(
             [1, round((buying_power / (await self._ticker.price)) // 100)]
         )
 
+    # NOTE(jkoelker) Plain integer arithmetic; numpy ufuncs on Python
+    #                scalars are all dispatch overhead
     @functools.cached_property
     def net_target_calls(self) -> int:
-        return int(
-            np.floor(self._ticker.num_shares / 100) - self._ticker.num_calls
-        )
+        return self._ticker.num_shares // 100 - self._ticker.num_calls
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def net_target_puts(self) -> int:
-        return int(
-            np.floor(await self.target_shares / 100) - self._ticker.num_puts
-        )
+        return await self.target_shares // 100 - self._ticker.num_puts
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def net_target_shares(self) -> int:
-        return int(
-            np.floor(
-                (await self.target_shares)
-                - self._ticker.num_shares
-                - (self._ticker.num_puts * 100),
-            )
+        return (
+            (await self.target_shares)
+            - self._ticker.num_shares
+            - (self._ticker.num_puts * 100)
         )
 
     @property
     def has_shares(self) -> bool:
         return self._ticker.num_shares > 0
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def excess_shares(self) -> int:
-        return np.abs(
-            int(np.floor((await self.target_shares) - self._ticker.num_shares))
-        )
+        return abs((await self.target_shares) - self._ticker.num_shares)
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def has_excess_shares(self) -> bool:
         if not self.has_shares:
             return False
@@ -168,29 +171,24 @@ class Wheel:
 
     @functools.cached_property
     def target_buying_power(self) -> float:
-        return self.account_summary.target_buying_power * self.config.weight
+        return self.account_summary.target_buying_power * self._weight
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def target_shares(self) -> int:
         # Round down to the nearest 100
-        return int(
-            np.floor(
-                self.target_buying_power / (await self._ticker.price) / 100
-            )
+        return (
+            int(self.target_buying_power / (await self._ticker.price) // 100)
             * 100
         )
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def to_write_calls(self) -> int:
         if self.net_target_calls < 0:
             return 0
 
         return min([await self.maximum_new_contracts, self.net_target_calls])
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def to_write_puts(self) -> int:
         if await self.net_target_puts < 0:
             return 0
@@ -199,15 +197,20 @@ class Wheel:
             [await self.maximum_new_contracts, await self.net_target_puts]
         )
 
-    @property
-    @alru.alru_cache(maxsize=1)
+    @cached_awaitable
     async def write_threshold(self) -> float:
-        return (
-            await self._ticker.close
-            * (np.exp(np.log((await self._ticker.history)["close"]).std()) - 1)
-            * self.config.sigma
+        # NOTE(jkoelker) Work on the raw array; np.log over the Series
+        #                re-wraps the result and drags the index along
+        close = (await self._ticker.history)["close"].to_numpy(
+            dtype=np.float64
         )
 
+        # NOTE(jkoelker) The stddev is a scalar by now; math.expm1 is
+        #                one libm call where the ufunc pays dispatch
+        sigma = float(np.log(close).std(ddof=1))
+
+        return await self._ticker.close * math.expm1(sigma) * self._sigma
+
     def __display_excess(self, num_contracts: int, put_call: str) -> None:
         excess = colorize(f"{num_contracts}", "yellow1")
 
@@ -233,6 +236,7 @@ class Wheel:
         self,
         progress: rich.progress.Progress,
         task: rich.progress.TaskID,
+        chain: Optional[pd.DataFrame] = None,
     ):
         add_tasks(progress, task, 5)
 
@@ -243,7 +247,12 @@ class Wheel:
 
         progress.advance(task)
 
-        if await self.to_write_calls == 0:
+        # NOTE(jkoelker) Bind the cached properties once; every extra
+        #                await is an event-loop round trip even on a
+        #                cache hit
+        num_contracts = await self.to_write_calls
+
+        if num_contracts == 0:
             self.__display_skipping("calls", "no calls to write")
 
             return self
@@ -251,7 +260,7 @@ class Wheel:
         progress.advance(task)
 
         if not await self.is_green:
-            to_write_calls = colorize(f"{await self.to_write_calls}", "cyan1")
+            to_write_calls = colorize(f"{num_contracts}", "cyan1")
             self.__display_skipping(
                 f"{to_write_calls} calls",
                 "underlying is not green",
@@ -261,11 +270,12 @@ class Wheel:
 
         progress.advance(task)
 
-        if await self._ticker.change < await self.write_threshold:
-            change = colorize(f"{(await self._ticker.change):.2f}", "cyan1")
-            threashold = colorize(
-                f"{(await self.write_threshold):.2f}", "cyan1"
-            )
+        ticker_change = await self._ticker.change
+        threshold = await self.write_threshold
+
+        if ticker_change < threshold:
+            change = colorize(f"{ticker_change:.2f}", "cyan1")
+            threashold = colorize(f"{threshold:.2f}", "cyan1")
 
             self.__display_skipping(
                 f"{self.net_target_calls} calls",
@@ -281,14 +291,15 @@ class Wheel:
 
             return self
 
-        num_contracts = await self.to_write_calls
         await self.__display_target(
             num_contracts, self.net_target_calls, "calls"
         )
 
+        if chain is None:
+            chain = await self.client.options(self.ticker)
+
         option = conditions.best(
-            await self.client.options(self.ticker),
-            filter_conditions=self.config.call_conditions,
+            chain, filter_conditions=self._call_conditions
         )
 
         if option is None or option.empty:
@@ -307,6 +318,7 @@ class Wheel:
         self,
         progress: rich.progress.Progress,
         task: rich.progress.TaskID,
+        chain: Optional[pd.DataFrame] = None,
     ):
         # pylint: disable=too-many-return-statements
 
@@ -326,18 +338,23 @@ class Wheel:
 
         progress.advance(task)
 
-        if await self.net_target_shares < 0:
-            net_target_shares = number(await self.net_target_shares)
+        # NOTE(jkoelker) Bind the cached properties once; every extra
+        #                await is an event-loop round trip even on a
+        #                cache hit
+        net_target_shares = await self.net_target_shares
+        net_target_puts = await self.net_target_puts
+        num_contracts = await self.to_write_puts
 
+        if net_target_shares < 0:
             self.__display_skipping(
                 "puts",
-                f"net target shares is negative ({net_target_shares})",
+                f"net target shares is negative ({number(net_target_shares)})",
             )
 
             return self
 
         if not await self.is_red:
-            to_write_puts = colorize(f"{await self.to_write_puts}", "cyan1")
+            to_write_puts = colorize(f"{num_contracts}", "cyan1")
 
             self.__display_skipping(
                 f"{to_write_puts} puts", "underlying is not red"
@@ -347,14 +364,15 @@ class Wheel:
 
         progress.advance(task)
 
-        if await self._ticker.change < await self.write_threshold:
-            change = colorize(f"{(await self._ticker.change):.2f}", "cyan1")
-            threashold = colorize(
-                f"{(await self.write_threshold):.2f}", "cyan1"
-            )
+        ticker_change = await self._ticker.change
+        threshold = await self.write_threshold
+
+        if ticker_change < threshold:
+            change = colorize(f"{ticker_change:.2f}", "cyan1")
+            threashold = colorize(f"{threshold:.2f}", "cyan1")
 
             self.__display_skipping(
-                f"{await self.net_target_puts} puts",
+                f"{net_target_puts} puts",
                 f"change ({change}) is less than threshold ({threashold})",
             )
 
@@ -362,8 +380,8 @@ class Wheel:
 
         progress.advance(task)
 
-        if await self.to_write_puts == 0:
-            target_puts = colorize(f"{await self.net_target_puts}", "cyan1")
+        if num_contracts == 0:
+            target_puts = colorize(f"{net_target_puts}", "cyan1")
 
             self.__display_skipping(f"{target_puts} puts", "no puts to write")
 
@@ -376,15 +394,12 @@ class Wheel:
 
             return self
 
-        num_contracts = await self.to_write_puts
-        await self.__display_target(
-            num_contracts, await self.net_target_puts, "puts"
-        )
+        await self.__display_target(num_contracts, net_target_puts, "puts")
 
-        option = conditions.best(
-            await self.client.options(self.ticker),
-            filter_conditions=self.config.put_conditions,
-        )
+        if chain is None:
+            chain = await self.client.options(self.ticker)
+
+        option = conditions.best(chain, filter_conditions=self._put_conditions)
 
         if option is None or option.empty:
             self.__display_skipping("puts", "no options meet conditions")
@@ -408,7 +423,13 @@ class Wheel:
                 f"Calculating wheel for {self.ticker}...",
             )
 
-            if (await self.client.options(self.ticker)).empty:
+            # NOTE(jkoelker) Convert the chain once; best() extracts a
+            #                single-row copy, so the frame is freed when
+            #                this call returns instead of being rebuilt
+            #                for every writer
+            chain = await self.client.options(self.ticker)
+
+            if chain.empty:
                 self.__display(
                     f"[cyan]Skipping {self.ticker}: no options[/cyan]"
                 )
@@ -417,9 +438,25 @@ class Wheel:
 
             await self._ticker(progress, task)
 
+            # NOTE(jkoelker) Warm the cached properties in one batch
+            #                so the writers' awaits below are cache
+            #                hits instead of serial dependency chains
+            await asyncio.gather(
+                self.is_red,
+                self.is_green,
+                self.maximum_new_contracts,
+                self.net_target_puts,
+                self.net_target_shares,
+                self.to_write_calls,
+                self.to_write_puts,
+                self.write_threshold,
+                self._ticker.change,
+                self._ticker.had_order_today,
+            )
+
             await asyncio.gather(
-                self.write_puts(progress, task),
-                self.write_calls(progress, task),
+                self.write_puts(progress, task, chain),
+                self.write_calls(progress, task, chain),
             )
 
             return self
@@ -2,46 +2,54 @@
 # Convert API responses to Pandas DataFrames
 #
 
+import re
 from typing import Optional
 
+import numpy as np
 import pandas as pd
 
+# NOTE(jkoelker) One precompiled pattern classifies the whole symbol
+#                in a single C-level pass. The lookahead rejects a
+#                second "_", and the P branch is tried first so a "P"
+#                anywhere in the remainder wins over an earlier "C",
+#                matching the old partition order
+_TICKER_RE = re.compile(
+    r"^(?P<underlying>[^_]*)"
+    r"(?:_(?!.*_)"
+    r"(?:(?P<put_expiration>[^P]*)P(?P<put_strike>.*)"
+    r"|(?P<call_expiration>[^C]*)C(?P<call_strike>.*)))?$"
+)
+
 
 def parse_ticker(ticker: str) -> Optional[dict]:
     """
     Parse a ticker string into a dictionary of values.
     """
-    # Check if "_" exists in the ticker, indicating it's an option
-    if "_" not in ticker:
+    match = _TICKER_RE.match(ticker)
+
+    if match is None:
+        return None  # Unrecognized format
+
+    underlying, put_expiration, put_strike, call_expiration, call_strike = (
+        match.groups()
+    )
+
+    # No "_" means it's an equity, not an option
+    if put_strike is None and call_strike is None:
         return {
             "asset_type": "EQUITY",
             "symbol": ticker,
             "underlying": ticker,
         }
 
-    # Split the ticker on "_"
-    parts = ticker.split("_")
-    if len(parts) != 2:
-        return None  # Unrecognized format
-
-    underlying = parts[0]
-    remainder = parts[1]
-
-    # Identify the ContractType and split the rest of the string accordingly
-    if "P" in remainder:
-        contract_type = "PUT"
-        parts = remainder.split("P", 1)
-
-    elif "C" in remainder:
-        contract_type = "CALL"
-        parts = remainder.split("C", 1)
-
+    if put_strike is not None:
+        contract_type, expiration, strike = "PUT", put_expiration, put_strike
     else:
-        return None  # Unrecognized format
-
-    # Extract expiration and strike
-    expiration = parts[0]
-    strike = parts[1]
+        contract_type, expiration, strike = (
+            "CALL",
+            call_expiration,
+            call_strike,
+        )
 
     return {
         "asset_type": "OPTION",
@@ -55,7 +63,10 @@ def parse_ticker(ticker: str) -> Optional[dict]:
 
 def accounts(data):
     """accounts as dataframe"""
-    return pd.json_normalize(data.values()).set_index("accountId")
+    if isinstance(data, dict):
+        data = data.values()
+
+    return pd.json_normalize(data).set_index("accountId")
 
 
 def transactions(data):
@@ -82,40 +93,122 @@ def quote(data):
     return pd.DataFrame(data).T.set_index("symbol")
 
 
-def history(data):
-    """get history as dataframe"""
+# NOTE(jkoelker) Candle timestamps are epoch milliseconds;
+#                reinterpreting the int64 buffer as datetime64[ms]
+#                skips the pd.to_datetime parsing machinery entirely
+#                and matches the dtype to_datetime(unit="ms") yields
+def _epoch_ms_to_datetime(values: pd.Series) -> np.ndarray:
+    return values.to_numpy(dtype=np.int64).view("datetime64[ms]")
+
+
+def history(data, parse_dates=True):
+    """get history as dataframe
+
+    `parse_dates=False` leaves the datetime column as epoch
+    milliseconds for callers that only do numeric work on it.
+    """
     df = pd.DataFrame(data["candles"])
-    df["datetime"] = pd.to_datetime(df["datetime"], unit="ms")
+
+    if parse_dates:
+        df["datetime"] = _epoch_ms_to_datetime(df["datetime"])
+
     return df
 
 
-def options(data):
-    """options chain as dataframe"""
-    ret = []
-    for date in data["callExpDateMap"]:
-        for strike in data["callExpDateMap"][date]:
-            ret.extend(data["callExpDateMap"][date][strike])
-    for date in data["putExpDateMap"]:
-        for strike in data["putExpDateMap"][date]:
-            ret.extend(data["putExpDateMap"][date][strike])
-
-    df = pd.DataFrame(ret)
-    for col in (
-        "tradeTimeInLong",
-        "quoteTimeInLong",
-        "expirationDate",
-        "lastTradingDay",
-    ):
-        if col in df.columns:
-            df[col] = pd.to_datetime(df[col], unit="ms")
-
-    for col in ("delta", "gamma", "theta", "vega", "rho", "volatility"):
-        if col in df.columns:
-            df[col] = pd.to_numeric(df[col], errors="coerce")
+# NOTE(jkoelker) Epoch-millisecond columns, float columns worth
+#                coercing, and the price/greek columns narrowed to
+#                float32 for the filter scans
+_DATETIME_COLUMNS = (
+    "tradeTimeInLong",
+    "quoteTimeInLong",
+    "expirationDate",
+    "lastTradingDay",
+)
+
+_NUMERIC_COLUMNS = ("delta", "gamma", "theta", "vega", "rho", "volatility")
+
+_FLOAT32_COLUMNS = (
+    "mark",
+    "strikePrice",
+    "ask",
+    "bid",
+    "last",
+    "delta",
+    "gamma",
+    "theta",
+    "vega",
+    "rho",
+    "volatility",
+    "intrinsicValue",
+    "timeValue",
+    "theoreticalOptionValue",
+)
+
+
+def options_records(data):
+    """options chain as a flat list of records"""
+    return [
+        record
+        for exp_map in (data["callExpDateMap"], data["putExpDateMap"])
+        for strikes in exp_map.values()
+        for records in strikes.values()
+        for record in records
+    ]
+
+
+def options_frame(records, columns=None):
+    """flat option records as a dataframe with normalized dtypes
+
+    `columns` optionally restricts the frame to those keys, so callers
+    that only touch a handful of fields never materialize the dozens of
+    greeks and metadata columns TDA returns.
+    """
+    if columns is not None:
+        columns = set(columns)
+        records = [
+            {key: value for key, value in record.items() if key in columns}
+            for record in records
+        ]
+
+    # NOTE(jkoelker) Zero records still needs the schema; callers
+    #                select on these columns and an all-filtered scan
+    #                should render as an empty table, not a KeyError
+    if not records and columns is not None:
+        df = pd.DataFrame(columns=sorted(columns))
+    else:
+        df = pd.DataFrame(records)
+
+    datetime_cols = [col for col in _DATETIME_COLUMNS if col in df.columns]
+    if datetime_cols:
+        df[datetime_cols] = df[datetime_cols].apply(pd.to_datetime, unit="ms")
+
+    numeric_cols = [col for col in _NUMERIC_COLUMNS if col in df.columns]
+    if numeric_cols:
+        df[numeric_cols] = df[numeric_cols].apply(
+            pd.to_numeric, errors="coerce"
+        )
+
+    # NOTE(jkoelker) Filter scans are bandwidth bound; float32 halves
+    #                the bytes moved and prices/greeks are nowhere near
+    #                needing double precision
+    float32_cols = [col for col in _FLOAT32_COLUMNS if col in df.columns]
+    if float32_cols:
+        df[float32_cols] = df[float32_cols].astype(np.float32, copy=False)
+
+    # NOTE(jkoelker) Two distinct values over thousands of rows;
+    #                dictionary encoding makes equality filters an
+    #                int8 compare instead of per-row string compares
+    if "putCall" in df.columns:
+        df["putCall"] = df["putCall"].astype("category")
 
     return df
 
 
+def options(data, columns=None):
+    """options chain as dataframe"""
+    return options_frame(options_records(data), columns=columns)
+
+
 def orders(data):
     """orders as dataframe"""
 
@@ -131,27 +224,42 @@ def orders(data):
 
 def positions(data):
     """positions list as a dataframe"""
-    ret = []
+    df = pd.json_normalize(data)
+
+    for col in ("assetType", "cusip", "symbol"):
+        key = f"instrument.{col}"
+        if key in df.columns:
+            df[col] = df[key]
 
-    for position in data:
-        instrument_position = position.pop("instrument", {})
-        for col in ("assetType", "cusip", "symbol"):
-            if col in instrument_position:
-                position[col] = instrument_position[col]
+    df = df.drop(
+        columns=[col for col in df.columns if col.startswith("instrument.")]
+    )
 
-        position.update(parse_ticker(position["symbol"]))
+    # NOTE(jkoelker) One regex pass splits every option symbol
+    #                (UNDERLYING_MMDDYY[CP]STRIKE) instead of running
+    #                parse_ticker per row
+    parts = df["symbol"].str.extract(
+        r"^(?P<underlying>[^_]+)"
+        r"(?:_(?P<expiration>[^PC]*)(?P<contract_type>[PC])"
+        r"(?P<strike>.*))?$"
+    )
 
-        if "expiration" in position:
-            position["expiration_date"] = pd.to_datetime(
-                position["expiration"], format="%m%d%y"
-            )
+    is_option = parts["contract_type"].notna()
 
-        if "strike" in position:
-            position["strike"] = pd.to_numeric(position["strike"])
+    df["asset_type"] = np.where(is_option, "OPTION", "EQUITY")
+    df["underlying"] = parts["underlying"]
 
-        ret.append(position)
+    if is_option.any():
+        df["expiration"] = parts["expiration"]
+        df["contract_type"] = parts["contract_type"].map(
+            {"P": "PUT", "C": "CALL"}
+        )
+        df["expiration_date"] = pd.to_datetime(
+            parts["expiration"], format="%m%d%y"
+        )
+        df["strike"] = pd.to_numeric(parts["strike"])
 
-    return pd.DataFrame(ret).set_index("symbol")
+    return df.set_index("symbol")
 
 
 def user_principals(data):
@@ -163,7 +271,7 @@ def price_history(data):
     df = pd.DataFrame(data["candles"])
 
     df["symbol"] = data["symbol"]
-    df["datetime"] = pd.to_datetime(df["datetime"], unit="ms")
+    df["datetime"] = _epoch_ms_to_datetime(df["datetime"])
 
     df.set_index("datetime", inplace=True)
 
@@ -1,10 +1,64 @@
 #
 
+import functools
+
 from tda import orders  # type: ignore
 
 
 def truncate_float(value, precision=2) -> str:
-    return f"{value:.{precision}f}"
+    # NOTE(jkoelker) The default runs on every price set; a literal
+    #                format spec skips re-parsing the nested f-string
+    #                spec each call
+    if precision == 2:
+        return f"{value:.2f}"
+
+    return format(value, f".{precision}f")
+
+
+# NOTE(jkoelker) One descriptor instead of ~17 property/setter/deleter
+#                triples; the class body shrinks and import time with
+#                it, while attribute access stays on the descriptor
+#                protocol fast path
+class _Delegate:
+    __slots__ = ("attr", "setter", "clearer")
+
+    def __init__(self, attr: str, setter: str, clearer: str) -> None:
+        self.attr = attr
+        self.setter = setter
+        self.clearer = clearer
+
+    def __get__(self, obj, objtype=None):
+        if obj is None:
+            return self
+
+        return getattr(obj, self.attr)
+
+    def __set__(self, obj, value) -> None:
+        getattr(obj, self.setter)(value)
+
+    def __delete__(self, obj) -> None:
+        getattr(obj, self.clearer)()
+
+
+_FIELDS = {
+    "session": "_session",
+    "duration": "_duration",
+    "order_type": "_orderType",
+    "complex_order_strategy_type": "_complexOrderStrategyType",
+    "quantity": "_quantity",
+    "requested_destination": "_requestedDestination",
+    "stop_price": "_stopPrice",
+    "stop_price_link_basis": "_stopPriceLinkBasis",
+    "stop_price_link_type": "_stopPriceLinkType",
+    "stop_price_offset": "_stopPriceOffset",
+    "stop_type": "_stopType",
+    "price_link_basis": "_priceLinkBasis",
+    "price_link_type": "_priceLinkType",
+    "price": "_price",
+    "activation_price": "_activationPrice",
+    "special_instruction": "_specialInstruction",
+    "order_strategy_type": "_orderStrategyType",
+}
 
 
 class OrderBuilder(orders.generic.OrderBuilder):
@@ -30,8 +84,19 @@ class OrderBuilder(orders.generic.OrderBuilder):
 
     OptionSymbol = orders.options.OptionSymbol
 
+    # NOTE(jkoelker) repr runs inside progress displays; cache the
+    #                built dict so unchanged builders skip the full
+    #                attribute-tree walk. Every mutator below is
+    #                wrapped to drop the cache. No leading underscore:
+    #                tda's _build_object serializes every non-None
+    #                underscore attribute into the order payload
+    built_cache = None
+
     def __repr__(self):
-        return f"OrderBuilder({self.build()})"
+        if self.built_cache is None:
+            self.built_cache = self.build()
+
+        return f"OrderBuilder({self.built_cache})"
 
     def set_stop_price(self, stop_price):
         if isinstance(stop_price, str):
@@ -49,210 +114,6 @@ class OrderBuilder(orders.generic.OrderBuilder):
 
         return self
 
-    @property
-    def session(self):
-        return self._session
-
-    @session.setter
-    def session(self, value):
-        self.set_session(value)
-
-    @session.deleter
-    def session(self):
-        self.clear_session()
-
-    @property
-    def duration(self):
-        return self._duration
-
-    @duration.setter
-    def duration(self, value):
-        self.set_duration(value)
-
-    @duration.deleter
-    def duration(self):
-        self.clear_duration()
-
-    @property
-    def order_type(self):
-        return self._orderType
-
-    @order_type.setter
-    def order_type(self, value):
-        self.set_order_type(value)
-
-    @order_type.deleter
-    def order_type(self):
-        self.clear_order_type()
-
-    @property
-    def complex_order_strategy_type(self):
-        return self._complexOrderStrategyType
-
-    @complex_order_strategy_type.setter
-    def complex_order_strategy_type(self, value):
-        self.set_complex_order_strategy_type(value)
-
-    @complex_order_strategy_type.deleter
-    def complex_order_strategy_type(self):
-        self.clear_complex_order_strategy_type()
-
-    @property
-    def quantity(self):
-        return self._quantity
-
-    @quantity.setter
-    def quantity(self, value):
-        self.set_quantity(value)
-
-    @quantity.deleter
-    def quantity(self):
-        self.clear_quantity()
-
-    @property
-    def requested_destination(self):
-        return self._requestedDestination
-
-    @requested_destination.setter
-    def requested_destination(self, value):
-        self.set_requested_destination(value)
-
-    @requested_destination.deleter
-    def requested_destination(self):
-        self.clear_requested_destination()
-
-    @property
-    def stop_price(self):
-        return self._stopPrice
-
-    @stop_price.setter
-    def stop_price(self, value):
-        self.set_stop_price(value)
-
-    @stop_price.deleter
-    def stop_price(self):
-        self.clear_stop_price()
-
-    @property
-    def stop_price_link_basis(self):
-        return self._stopPriceLinkBasis
-
-    @stop_price_link_basis.setter
-    def stop_price_link_basis(self, value):
-        self.set_stop_price_link_basis(value)
-
-    @stop_price_link_basis.deleter
-    def stop_price_link_basis(self):
-        self.clear_stop_price_link_basis()
-
-    @property
-    def stop_price_link_type(self):
-        return self._stopPriceLinkType
-
-    @stop_price_link_type.setter
-    def stop_price_link_type(self, value):
-        self.set_stop_price_link_type(value)
-
-    @stop_price_link_type.deleter
-    def stop_price_link_type(self):
-        self.clear_stop_price_link_type()
-
-    @property
-    def stop_price_offset(self):
-        return self._stopPriceOffset
-
-    @stop_price_offset.setter
-    def stop_price_offset(self, value):
-        self.set_stop_price_offset(value)
-
-    @stop_price_offset.deleter
-    def stop_price_offset(self):
-        self.clear_stop_price_offset()
-
-    @property
-    def stop_type(self):
-        return self._stopType
-
-    @stop_type.setter
-    def stop_type(self, value):
-        self.set_stop_type(value)
-
-    @stop_type.deleter
-    def stop_type(self):
-        self.clear_stop_type()
-
-    @property
-    def price_link_basis(self):
-        return self._priceLinkBasis
-
-    @price_link_basis.setter
-    def price_link_basis(self, value):
-        self.set_price_link_basis(value)
-
-    @price_link_basis.deleter
-    def price_link_basis(self):
-        self.clear_price_link_basis()
-
-    @property
-    def price_link_type(self):
-        return self._priceLinkType
-
-    @price_link_type.setter
-    def price_link_type(self, value):
-        self.set_price_link_type(value)
-
-    @price_link_type.deleter
-    def price_link_type(self):
-        self.clear_price_link_type()
-
-    @property
-    def price(self):
-        return self._price
-
-    @price.setter
-    def price(self, value):
-        self.set_price(value)
-
-    @price.deleter
-    def price(self):
-        self.clear_price()
-
-    @property
-    def activation_price(self):
-        return self._activationPrice
-
-    @activation_price.setter
-    def activation_price(self, value):
-        self.set_activation_price(value)
-
-    @activation_price.deleter
-    def activation_price(self):
-        self.clear_activation_price()
-
-    @property
-    def special_instruction(self):
-        return self._specialInstruction
-
-    @special_instruction.setter
-    def special_instruction(self, value):
-        self.set_special_instruction(value)
-
-    @special_instruction.deleter
-    def special_instruction(self):
-        self.clear_special_instruction()
-
-    @property
-    def order_strategy_type(self):
-        return self._orderStrategyType
-
-    @order_strategy_type.setter
-    def order_strategy_type(self, value):
-        self.set_order_strategy_type(value)
-
-    @order_strategy_type.deleter
-    def order_strategy_type(self):
-        self.clear_order_strategy_type()
-
     @classmethod
     def base_order(cls):
         return (
@@ -362,3 +223,31 @@ class OrderBuilder(orders.generic.OrderBuilder):
             .market_order()
             .add_equity_leg(cls.EquityInstruction.BUY, symbol, quantity)
         )
+
+
+for _name, _attr in _FIELDS.items():
+    setattr(
+        OrderBuilder,
+        _name,
+        _Delegate(_attr, f"set_{_name}", f"clear_{_name}"),
+    )
+
+del _name, _attr
+
+
+def _invalidating(method):
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        self.built_cache = None
+        return method(self, *args, **kwargs)
+
+    return wrapper
+
+
+for _name in dir(OrderBuilder):
+    if _name.startswith(("set_", "clear_", "add_")):
+        setattr(
+            OrderBuilder, _name, _invalidating(getattr(OrderBuilder, _name))
+        )
+
+del _name